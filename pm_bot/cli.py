@@ -11,8 +11,8 @@ import requests
 import typer
 
 from pm_bot.github.body_parser import parse_child_refs
-from pm_bot.github.parse_issue_body import parse_issue_body
-from pm_bot.github.render_issue_body import FIELD_TO_HEADING, load_template_map, render_issue_body
+from pm_bot.github.parse_issue_body import load_template_map, parse_issue_body
+from pm_bot.github.render_issue_body import FIELD_TO_HEADING, render_issue_body
 from pm_bot.control_plane.api.app import create_app
 from pm_bot.validation import validate_work_item
 
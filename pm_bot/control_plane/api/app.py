@@ -7,10 +7,11 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from urllib.parse import parse_qs, urlparse, unquote
+from urllib.parse import parse_qs
 from typing import Any
 
 from pm_bot.control_plane.artifacts.changesets import ChangesetService
+from pm_bot.control_plane.artifacts.store import ArtifactBlobStore, FilesystemBlobStore
 from pm_bot.control_plane.context.context_pack import build_context_pack
 from pm_bot.control_plane.db.db import OrchestratorDB
 from pm_bot.control_plane.orchestration.estimator import EstimatorService
@@ -18,7 +19,10 @@ from pm_bot.control_plane.github.github_auth import (
     load_tenant_context_from_env,
     validate_org_and_installation_context,
 )
-from pm_bot.control_plane.github.github_connector import build_connector_from_env
+from pm_bot.control_plane.github.github_connector import (
+    GitHubConnector,
+    build_connector_from_env,
+)
 from pm_bot.control_plane.github.sync_service import GitHubCacheSyncService
 from pm_bot.control_plane.orchestration.graph import GraphService
 from pm_bot.execution_plane.llm import (
@@ -49,10 +53,29 @@ from pm_bot.control_plane.rag.ingestion import DocsIngestionService, QueryFilter
 class ServerApp:
     """Thin callable facade mirroring intended API endpoints."""
 
-    def __init__(self, db_path: str | Path = ":memory:") -> None:
-        self.db = OrchestratorDB(db_path)
+    def __init__(
+        self,
+        db_path: str | Path = ":memory:",
+        blob_store: ArtifactBlobStore | None = None,
+        connector: GitHubConnector | None = None,
+        runner_default_adapter: str | None = None,
+        db: OrchestratorDB | None = None,
+    ) -> None:
+        self.db = db if db is not None else OrchestratorDB(db_path)
+        # Byte-level store for plan-aggregation artifacts; runner adapters keep using the DB.
+        self.blob_store: ArtifactBlobStore = blob_store or FilesystemBlobStore()
+        self._connector_override = connector
+        self._runner_default_adapter = runner_default_adapter
+        self._init_services()
+
+    def reset(self) -> None:
+        """Clear all persisted rows and rebuild in-process services on the same database."""
+        self.db.reset()
+        self._init_services()
+
+    def _init_services(self) -> None:
         self.tenant = load_tenant_context_from_env(os.environ)
-        self.connector = build_connector_from_env()
+        self.connector = self._connector_override or build_connector_from_env()
         self.sync_service = GitHubCacheSyncService(db=self.db, connector=self.connector)
         self.changesets = ChangesetService(db=self.db, connector=self.connector)
         self.estimator = EstimatorService(db=self.db)
@@ -66,6 +89,7 @@ class ServerApp:
             default_adapter_name=default_runner_adapter_name(
                 os.environ,
                 adapters=runner_adapters,
+                configured=self._runner_default_adapter,
             ),
         )
         self._poll_interval_minutes = max(1, int(os.environ.get("PM_BOT_SYNC_POLL_MINUTES", "5")))
@@ -535,10 +559,10 @@ class ServerApp:
                 for row in bundle_candidates
             ],
         }
-        settings = get_storage_settings()
-        output_path = Path(settings.artifact_dir) / f"{plan_id}.aggregated_changeset_bundle.json"
-        output_path.write_text(json.dumps(aggregated, sort_keys=True, indent=2), encoding="utf-8")
-        output_uri = output_path.resolve().as_uri()
+        output_uri = self.blob_store.put(
+            f"{plan_id}.aggregated_changeset_bundle.json",
+            json.dumps(aggregated, sort_keys=True, indent=2).encode("utf-8"),
+        )
 
         payload["aggregation"] = {
             "schema_version": "orchestration_aggregation/v1",
@@ -568,13 +592,10 @@ class ServerApp:
         return payload["aggregation"]
 
     def _read_changeset_bundle_artifact(self, uri: str) -> dict[str, Any] | None:
-        parsed = urlparse(uri)
-        if parsed.scheme != "file":
+        raw = self.blob_store.get(uri)
+        if raw is None:
             return None
-        path = Path(unquote(parsed.path))
-        if not path.exists():
-            return None
-        parsed_payload = json.loads(path.read_text(encoding="utf-8"))
+        parsed_payload = json.loads(raw)
         changeset_bundle = parsed_payload.get("changeset_bundle")
         return changeset_bundle if isinstance(changeset_bundle, dict) else None
 
@@ -2408,7 +2429,7 @@ class ASGIServer:
         if not body:
             return {}
         try:
-            parsed = json.loads(body.decode("utf-8"))
+            parsed = json.loads(body)
         except (UnicodeDecodeError, json.JSONDecodeError):
             return None
         if not isinstance(parsed, dict):
@@ -2427,21 +2448,33 @@ class ASGIServer:
         await send({"type": "http.response.body", "body": body})
 
 
-def create_app(db_path: str | Path = ":memory:") -> ServerApp:
-    return ServerApp(db_path=db_path)
+def create_app(
+    db_path: str | Path = ":memory:",
+    connector: GitHubConnector | None = None,
+    runner_default_adapter: str | None = None,
+    db: OrchestratorDB | None = None,
+    blob_store: ArtifactBlobStore | None = None,
+) -> ServerApp:
+    return ServerApp(
+        db_path=db_path,
+        blob_store=blob_store,
+        connector=connector,
+        runner_default_adapter=runner_default_adapter,
+        db=db,
+    )
 
 
 app = ASGIServer()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="pm-bot ASGI server entrypoint")
     parser.add_argument(
         "--print-startup",
         action="store_true",
         help="print the supported uvicorn startup command and exit",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.print_startup:
         print("uvicorn pm_bot.server.app:app --host 127.0.0.1 --port 8000")
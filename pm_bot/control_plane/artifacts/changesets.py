@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from collections.abc import Callable
 from typing import Any
 
 from pm_bot.control_plane.db.db import OrchestratorDB
@@ -23,12 +24,14 @@ class ChangesetService:
         max_retries: int = 2,
         base_backoff_ms: int = 100,
         max_backoff_ms: int = 1000,
+        sleep: Callable[[float], None] = time.sleep,
     ) -> None:
         self.db = db
         self.connector = connector
         self.max_retries = max_retries
         self.base_backoff_ms = base_backoff_ms
         self.max_backoff_ms = max_backoff_ms
+        self.sleep = sleep
 
     def _compute_backoff_ms(self, attempt: int, retry_after_s: float | None) -> int:
         scheduled_ms = min(self.max_backoff_ms, self.base_backoff_ms * (2 ** max(attempt - 1, 0)))
@@ -199,7 +202,7 @@ class ChangesetService:
                         tenant_context=resolved_tenant_context,
                     )
                     raise RuntimeError("Changeset failed: retry_budget_exhausted") from exc
-                time.sleep(backoff_ms / 1000)
+                self.sleep(backoff_ms / 1000)
             except Exception as exc:
                 latency_ms = (time.perf_counter() - started) * 1000
                 self.db.record_operation_metric("changeset_write", "failure", latency_ms)
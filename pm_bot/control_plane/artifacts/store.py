@@ -0,0 +1,59 @@
+"""Byte-level artifact storage backends used by plan aggregation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Protocol
+from urllib.parse import unquote, urlparse
+
+from pm_bot.shared.settings import get_storage_settings
+
+
+class ArtifactBlobStore(Protocol):
+    def get(self, uri: str) -> bytes | None: ...
+
+    def put(self, name: str, data: bytes) -> str: ...
+
+
+class FilesystemBlobStore:
+    """Store artifacts as files under the configured artifact directory, addressed by file URIs."""
+
+    def __init__(self, artifact_dir: str | Path | None = None) -> None:
+        self._artifact_dir = Path(artifact_dir) if artifact_dir is not None else None
+
+    def _resolve_dir(self) -> Path:
+        if self._artifact_dir is not None:
+            self._artifact_dir.mkdir(parents=True, exist_ok=True)
+            return self._artifact_dir
+        return Path(get_storage_settings().artifact_dir)
+
+    def get(self, uri: str) -> bytes | None:
+        parsed = urlparse(uri)
+        if parsed.scheme != "file":
+            return None
+        path = Path(unquote(parsed.path))
+        if not path.exists():
+            return None
+        return path.read_bytes()
+
+    def put(self, name: str, data: bytes) -> str:
+        path = self._resolve_dir() / name
+        path.write_bytes(data)
+        return path.resolve().as_uri()
+
+
+class InMemoryBlobStore:
+    """Dict-backed artifact store addressed by ``mem://`` URIs; nothing touches disk."""
+
+    SCHEME = "mem://"
+
+    def __init__(self) -> None:
+        self.blobs: dict[str, bytes] = {}
+
+    def get(self, uri: str) -> bytes | None:
+        return self.blobs.get(uri)
+
+    def put(self, name: str, data: bytes) -> str:
+        uri = f"{self.SCHEME}{name}"
+        self.blobs[uri] = data
+        return uri
@@ -7,6 +7,10 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+# Rows per multi-row audit INSERT; three bound values each keeps a statement under SQLite's
+# historical 999-parameter limit.
+_AUDIT_INSERT_CHUNK_ROWS = 333
+
 
 class OrchestratorDB:
     """Small SQLite wrapper for work items, changesets, approvals, and audit events."""
@@ -20,6 +24,46 @@ class OrchestratorDB:
         self._configure_connection()
         self._init_schema()
 
+    def clone_in_memory(self) -> OrchestratorDB:
+        """Return an independent in-memory copy of this database, schema and rows included.
+
+        Pages are copied with SQLite's backup API, so schema DDL and column migrations are
+        not replayed; this is the cheap way to stamp out isolated databases from a template.
+        """
+
+        clone = object.__new__(type(self))
+        clone.db_path = ":memory:"
+        clone.conn = sqlite3.connect(clone.db_path, check_same_thread=False)
+        clone.conn.row_factory = sqlite3.Row
+        self.conn.backup(clone.conn)
+        clone._configure_connection()
+        return clone
+
+    def reset(self) -> None:
+        """Delete every row while keeping the migrated schema, then restore seeded defaults."""
+
+        tables = [
+            row["name"]
+            for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            for table in tables:
+                self.conn.execute(f'DELETE FROM "{table}"')
+            if self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_sequence'"
+            ).fetchone():
+                self.conn.execute("DELETE FROM sqlite_sequence")
+            self._seed_defaults()
+            self.conn.commit()
+        finally:
+            self.conn.execute("PRAGMA foreign_keys=ON")
+
+    def _seed_defaults(self) -> None:
+        self.conn.execute("INSERT OR IGNORE INTO workspaces (id, name) VALUES (1, 'default')")
+
     def _configure_connection(self) -> None:
         """Apply local-first SQLite settings for durability and concurrent reads."""
 
@@ -416,7 +460,7 @@ class OrchestratorDB:
             self.conn.execute("ALTER TABLE agent_runs ADD COLUMN thread_id TEXT")
         if not self._has_column("agent_runs", "graph_id"):
             self.conn.execute("ALTER TABLE agent_runs ADD COLUMN graph_id TEXT DEFAULT ''")
-        self.conn.execute("INSERT OR IGNORE INTO workspaces (id, name) VALUES (1, 'default')")
+        self._seed_defaults()
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_repo_registry_workspace ON repo_registry(workspace_id, full_name)"
         )
@@ -450,6 +494,9 @@ class OrchestratorDB:
         self.conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_agent_runs_queue ON agent_runs(status, next_attempt_at, id)"
         )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audit_events_type_id ON audit_events(event_type, id)"
+        )
         self.conn.execute(
             "CREATE TABLE IF NOT EXISTS run_interrupts ("
             "id INTEGER PRIMARY KEY AUTOINCREMENT,"
@@ -522,7 +569,11 @@ class OrchestratorDB:
         return any(row[1] == column for row in rows)
 
     def upsert_work_item(self, issue_ref: str, payload: dict[str, Any]) -> None:
-        self.conn.execute(
+        self.upsert_work_items([(issue_ref, payload)])
+
+    def upsert_work_items(self, items: list[tuple[str, dict[str, Any]]]) -> None:
+        """Upsert many ``(issue_ref, payload)`` work items in one statement and commit."""
+        self.conn.executemany(
             """
             INSERT INTO work_items (issue_ref, title, item_type, payload_json)
             VALUES (?, ?, ?, ?)
@@ -531,7 +582,10 @@ class OrchestratorDB:
               item_type=excluded.item_type,
               payload_json=excluded.payload_json
             """,
-            (issue_ref, payload.get("title", ""), payload.get("type", ""), json.dumps(payload)),
+            [
+                (issue_ref, payload.get("title", ""), payload.get("type", ""), json.dumps(payload))
+                for issue_ref, payload in items
+            ],
         )
         self.conn.commit()
 
@@ -630,14 +684,27 @@ class OrchestratorDB:
         payload: dict[str, Any],
         tenant_context: dict[str, Any] | None = None,
     ) -> None:
-        self.conn.execute(
-            "INSERT INTO audit_events (event_type, event_json, tenant_context_json) VALUES (?, ?, ?)",
-            (
-                event_type,
-                json.dumps(payload),
-                json.dumps(self._normalize_tenant_context(tenant_context), sort_keys=True),
-            ),
-        )
+        self.append_audit_events([(event_type, payload)], tenant_context=tenant_context)
+
+    def append_audit_events(
+        self,
+        events: list[tuple[str, dict[str, Any]]],
+        tenant_context: dict[str, Any] | None = None,
+    ) -> None:
+        """Append many ``(event_type, payload)`` audit events with multi-row inserts and commit."""
+        tenant_json = json.dumps(self._normalize_tenant_context(tenant_context), sort_keys=True)
+        for start in range(0, len(events), _AUDIT_INSERT_CHUNK_ROWS):
+            chunk = events[start : start + _AUDIT_INSERT_CHUNK_ROWS]
+            placeholders = ", ".join(["(?, ?, ?)"] * len(chunk))
+            self.conn.execute(
+                "INSERT INTO audit_events (event_type, event_json, tenant_context_json) "
+                f"VALUES {placeholders}",
+                [
+                    value
+                    for event_type, payload in chunk
+                    for value in (event_type, json.dumps(payload), tenant_json)
+                ],
+            )
         self.conn.commit()
 
     def add_relationship(self, parent_ref: str, child_ref: str, source: str = "checklist") -> None:
@@ -854,6 +921,11 @@ class OrchestratorDB:
             for row in rows
         ]
 
+    def change_token(self) -> tuple[int, int]:
+        """Return a cheap token that changes whenever this or another connection writes rows."""
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return self.conn.total_changes, int(data_version)
+
     def list_work_items(self) -> list[dict[str, Any]]:
         rows = self.conn.execute("SELECT payload_json FROM work_items ORDER BY issue_ref ASC")
         return [json.loads(row[0]) for row in rows]
@@ -1259,6 +1331,15 @@ class OrchestratorDB:
         self.conn.commit()
         return int(cur.rowcount or 0) > 0
 
+    def expire_task_run_claim(self, task_run_id: str) -> None:
+        """Backdate a task run's lease so another worker may reclaim it immediately."""
+        self.conn.execute(
+            "UPDATE task_runs SET claim_expires_at = datetime(CURRENT_TIMESTAMP, '-1 seconds') "
+            "WHERE task_run_id = ?",
+            (task_run_id,),
+        )
+        self.conn.commit()
+
     def update_task_run_result(
         self,
         task_run_id: str,
@@ -1297,6 +1378,42 @@ class OrchestratorDB:
         self.conn.execute(f"UPDATE task_runs SET {', '.join(updates)} WHERE task_run_id = ?", args)
         self.conn.commit()
 
+    def bulk_update_task_run_results(
+        self, results: list[dict[str, Any]], *, clear_claim: bool = False
+    ) -> None:
+        """Apply ``update_task_run_result``-style outcomes to many task runs in one statement.
+
+        Each result carries ``task_run_id`` and ``status`` plus optional ``run_id``, ``thread_id``,
+        and ``reason_code``; omitted values leave the stored column unchanged.
+        """
+        claim_updates = ", claimed_by = NULL, claim_expires_at = NULL" if clear_claim else ""
+        self.conn.executemany(
+            f"""
+            UPDATE task_runs SET
+                status = ?,
+                updated_at = CURRENT_TIMESTAMP,
+                next_attempt_at = CASE
+                    WHEN ? IN ('succeeded', 'failed') THEN NULL ELSE next_attempt_at
+                END,
+                run_id = COALESCE(?, run_id),
+                thread_id = COALESCE(?, thread_id),
+                last_error_code = COALESCE(NULLIF(?, ''), last_error_code){claim_updates}
+            WHERE task_run_id = ?
+            """,
+            [
+                (
+                    result["status"],
+                    result["status"],
+                    result.get("run_id"),
+                    result.get("thread_id"),
+                    result.get("reason_code", ""),
+                    result["task_run_id"],
+                )
+                for result in results
+            ],
+        )
+        self.conn.commit()
+
     def list_task_edges(self, plan_id: str) -> list[dict[str, str]]:
         rows = self.conn.execute(
             """
@@ -1483,26 +1600,28 @@ class OrchestratorDB:
         self,
         event_type: str | None = None,
         run_id: str | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        if event_type and run_id:
-            rows = self.conn.execute(
-                "SELECT id, event_type, event_json, tenant_context_json, created_at FROM audit_events WHERE event_type = ? AND json_extract(event_json, '$.run_id') = ? ORDER BY id ASC",
-                (event_type, run_id),
-            )
-        elif event_type:
-            rows = self.conn.execute(
-                "SELECT id, event_type, event_json, tenant_context_json, created_at FROM audit_events WHERE event_type = ? ORDER BY id ASC",
-                (event_type,),
-            )
-        elif run_id:
-            rows = self.conn.execute(
-                "SELECT id, event_type, event_json, tenant_context_json, created_at FROM audit_events WHERE json_extract(event_json, '$.run_id') = ? ORDER BY id ASC",
-                (run_id,),
-            )
+        """Return matching audit events oldest first; ``limit`` keeps only the newest N."""
+        clauses: list[str] = []
+        args: list[Any] = []
+        if event_type:
+            clauses.append("event_type = ?")
+            args.append(event_type)
+        if run_id:
+            clauses.append("json_extract(event_json, '$.run_id') = ?")
+            args.append(run_id)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = (
+            "SELECT id, event_type, event_json, tenant_context_json, created_at "
+            f"FROM audit_events{where}"
+        )
+        if limit is None:
+            rows = list(self.conn.execute(f"{query} ORDER BY id ASC", args))
         else:
-            rows = self.conn.execute(
-                "SELECT id, event_type, event_json, tenant_context_json, created_at FROM audit_events ORDER BY id ASC"
-            )
+            # Walk the (event_type, id) index backwards and stop after ``limit`` rows.
+            rows = self.conn.execute(f"{query} ORDER BY id DESC LIMIT ?", [*args, int(limit)])
+            rows = list(reversed(rows.fetchall()))
         return [
             {
                 "id": int(row["id"]),
@@ -1517,12 +1636,26 @@ class OrchestratorDB:
     def store_estimate_snapshot(
         self, bucket_key: str, p50: float, p80: float, sample_count: int, method: str
     ) -> None:
-        self.conn.execute(
+        self.store_estimate_snapshots(
+            [
+                {
+                    "bucket_key": bucket_key,
+                    "p50": p50,
+                    "p80": p80,
+                    "sample_count": sample_count,
+                    "method": method,
+                }
+            ]
+        )
+
+    def store_estimate_snapshots(self, snapshots: list[dict[str, Any]]) -> None:
+        """Insert many estimate snapshots in one statement and commit."""
+        self.conn.executemany(
             """
             INSERT INTO estimate_snapshots (bucket_key, p50, p80, sample_count, method)
-            VALUES (?, ?, ?, ?, ?)
+            VALUES (:bucket_key, :p50, :p80, :sample_count, :method)
             """,
-            (bucket_key, p50, p80, sample_count, method),
+            snapshots,
         )
         self.conn.commit()
 
@@ -1749,23 +1882,19 @@ class OrchestratorDB:
             """,
             (worker_id, limit),
         ).fetchall()
-        claimed_runs: list[dict[str, Any]] = []
-        for row in rows:
-            run_id = str(row["run_id"])
-            self.conn.execute(
-                """
-                UPDATE agent_runs
-                SET claimed_by = ?,
-                    claim_expires_at = datetime(CURRENT_TIMESTAMP, '+' || ? || ' seconds')
-                WHERE run_id = ?
-                """,
-                (worker_id, int(lease_seconds), run_id),
-            )
-            fetched = self.get_agent_run(run_id)
-            if fetched is not None:
-                claimed_runs.append(fetched)
+        run_ids = [str(row["run_id"]) for row in rows]
+        self.conn.executemany(
+            """
+            UPDATE agent_runs
+            SET claimed_by = ?,
+                claim_expires_at = datetime(CURRENT_TIMESTAMP, '+' || ? || ' seconds')
+            WHERE run_id = ?
+            """,
+            [(worker_id, int(lease_seconds), run_id) for run_id in run_ids],
+        )
         self.conn.commit()
-        return claimed_runs
+        claimed_runs = [self.get_agent_run(run_id) for run_id in run_ids]
+        return [run for run in claimed_runs if run is not None]
 
     def clear_agent_run_claim(self, run_id: str) -> None:
         self.conn.execute(
@@ -1774,6 +1903,14 @@ class OrchestratorDB:
         )
         self.conn.commit()
 
+    def mark_agent_run_claimable(self, run_id: str) -> None:
+        """Make a run's scheduled retry due now so the next claim can pick it up."""
+        self.conn.execute(
+            "UPDATE agent_runs SET next_attempt_at = CURRENT_TIMESTAMP WHERE run_id = ?",
+            (run_id,),
+        )
+        self.conn.commit()
+
     def set_agent_run_execution(
         self,
         run_id: str,
@@ -1852,19 +1989,27 @@ class OrchestratorDB:
         }
 
     def set_agent_run_artifacts(self, run_id: str, artifact_paths: list[str]) -> None:
-        normalized = [str(path) for path in artifact_paths]
-        self.conn.execute(
+        self.bulk_set_agent_run_artifacts({run_id: artifact_paths})
+
+    def bulk_set_agent_run_artifacts(self, artifacts_by_run: dict[str, list[str]]) -> None:
+        normalized = {
+            run_id: [str(path) for path in paths] for run_id, paths in artifacts_by_run.items()
+        }
+        self.conn.executemany(
             "UPDATE agent_runs SET artifact_paths_json = ? WHERE run_id = ?",
-            (json.dumps(normalized, sort_keys=True), run_id),
+            [(json.dumps(paths, sort_keys=True), run_id) for run_id, paths in normalized.items()],
+        )
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO run_artifacts (artifact_id, run_id, kind, uri, metadata_json)
+            VALUES (?, ?, 'log', ?, '{}')
+            """,
+            [
+                (f"{run_id}:artifact:{idx}", run_id, path)
+                for run_id, paths in normalized.items()
+                for idx, path in enumerate(paths)
+            ],
         )
-        for idx, path in enumerate(normalized):
-            self.conn.execute(
-                """
-                INSERT OR REPLACE INTO run_artifacts (artifact_id, run_id, kind, uri, metadata_json)
-                VALUES (?, ?, 'log', ?, '{}')
-                """,
-                (f"{run_id}:artifact:{idx}", run_id, path),
-            )
         self.conn.commit()
 
     def list_run_artifacts(self, run_id: str) -> list[dict[str, Any]]:
@@ -1985,6 +2130,30 @@ class OrchestratorDB:
             ).fetchall()
         return [self.get_run_interrupt(str(row[0])) for row in rows if row is not None]
 
+    def snapshot_run_state(self, run_id: str) -> dict[str, Any]:
+        """Return a run's row, interrupts, and audit events grouped by type.
+
+        The reads share one transaction so the three views come from the same database state.
+        """
+        owns_transaction = not self.conn.in_transaction
+        if owns_transaction:
+            self.conn.execute("BEGIN")
+        try:
+            agent_run = self.get_agent_run(run_id)
+            interrupts = self.list_run_interrupts(run_id=run_id)
+            events = self.list_audit_events(run_id=run_id)
+        finally:
+            if owns_transaction:
+                self.conn.commit()
+        audit_events: dict[str, list[dict[str, Any]]] = {}
+        for event in events:
+            audit_events.setdefault(event["event_type"], []).append(event)
+        return {
+            "agent_run": agent_run,
+            "interrupts": interrupts,
+            "audit_events": audit_events,
+        }
+
     def upsert_document(
         self,
         *,
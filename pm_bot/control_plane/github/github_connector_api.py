@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json as jsonlib
 import time
 from typing import Any
 
@@ -284,12 +285,16 @@ class GitHubAPIConnector:
         }
         if token:
             headers["Authorization"] = f"Bearer {token}"
+        body: bytes | None = None
+        if json is not None:
+            headers["Content-Type"] = "application/json"
+            body = _encode_json_body(json)
 
         response = self.session.request(
             method=method,
             url=f"{self.base_url}{path}",
             headers=headers,
-            json=json,
+            data=body,
             params=params,
             timeout=15,
         )
@@ -331,6 +336,13 @@ class GitHubAPIConnector:
         return payload
 
 
+def _encode_json_body(payload: dict[str, Any]) -> bytes:
+    # Compact, UTF-8 encoded once here instead of requests' default spaced ASCII encoding.
+    return jsonlib.dumps(
+        payload, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode("utf-8")
+
+
 def _issue_number_from_ref(issue_ref: str) -> int:
     ref = issue_ref.strip()
     if ref.startswith("#"):
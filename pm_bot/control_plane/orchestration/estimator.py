@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 from math import ceil
+from operator import itemgetter
 from typing import Any
 
 from pm_bot.control_plane.db.db import OrchestratorDB
@@ -38,7 +40,10 @@ class EstimatorService:
         self.default_min_samples = max(1, int(default_min_samples))
         self._min_samples_by_bucket_key: dict[str, int] = {}
         self._min_samples_by_level: dict[tuple[str, ...], int] = {}
-        self._last_exclusion_reasons: dict[str, int] = {}
+        self._last_fingerprint: bytes | None = None
+        self._last_snapshots: list[dict[str, Any]] = []
+        self._exclusions: dict[str, int] = {}
+        self._exclusions_token: tuple[int, int] | None = None
 
         for bucket, threshold in (min_samples_by_bucket or {}).items():
             normalized = max(1, int(threshold))
@@ -92,33 +97,65 @@ class EstimatorService:
         return out, exclusions
 
     def exclusion_reasons(self) -> dict[str, int]:
-        return dict(self._last_exclusion_reasons)
+        """Count work items currently excluded from estimation, by reason.
+
+        Counts are reused until the database reports a write, so repeated calls between
+        upserts do not rescan every work item.
+        """
+        if self._exclusions_token != self.db.change_token():
+            self._remember_exclusions(self._historical_items()[1])
+        return dict(self._exclusions)
+
+    def _remember_exclusions(self, exclusions: dict[str, int]) -> None:
+        self._exclusions = dict(exclusions)
+        self._exclusions_token = self.db.change_token()
+
+    @staticmethod
+    def _fingerprint(history: list[dict[str, Any]], exclusions: dict[str, int]) -> bytes:
+        samples = sorted(
+            (item["type"], item["area"], item["size"], item["actual_hrs"]) for item in history
+        )
+        payload = repr((samples, sorted(exclusions.items()))).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=8).digest()
+
+    def _stored_snapshots_match(self, snapshots: list[dict[str, Any]]) -> bool:
+        latest = {row["bucket_key"]: row for row in self.db.latest_estimate_snapshots()}
+        for snapshot in snapshots:
+            stored = latest.get(snapshot["bucket_key"])
+            if stored is None or any(
+                stored[field] != snapshot[field]
+                for field in ("p50", "p80", "sample_count", "method")
+            ):
+                return False
+        return True
 
     def build_snapshots(self) -> list[dict[str, Any]]:
         history, exclusions = self._historical_items()
-        self._last_exclusion_reasons = exclusions
         self.db.append_audit_event(
             "estimator_samples_excluded",
             {"reasons": exclusions, "excluded_total": sum(exclusions.values())},
         )
+        # Unchanged samples produce identical snapshots; skip re-aggregating and re-storing them,
+        # but only while the database still serves the snapshots this instance last stored.
+        fingerprint = self._fingerprint(history, exclusions)
+        if fingerprint == self._last_fingerprint and self._stored_snapshots_match(
+            self._last_snapshots
+        ):
+            self._remember_exclusions(exclusions)
+            return [dict(row) for row in self._last_snapshots]
+        # Sorting once up front keeps every bucket's samples in ascending order as they are
+        # grouped, so nearest-rank quantiles index directly without a per-bucket sort.
+        ordered = sorted(history, key=itemgetter("actual_hrs"))
         snapshots: list[dict[str, Any]] = []
         for keys in self.FALLBACKS:
             groups: dict[str, list[float]] = {}
-            for item in history:
+            for item in ordered:
                 bucket = self._bucket_key(item, keys)
                 groups.setdefault(bucket, []).append(item["actual_hrs"])
-            for bucket_key, values in groups.items():
-                values_sorted = sorted(values)
+            for bucket_key, values_sorted in groups.items():
                 p50 = _quantile(values_sorted, 0.5)
                 p80 = _quantile(values_sorted, 0.8)
                 method = "nearest-rank"
-                self.db.store_estimate_snapshot(
-                    bucket_key=bucket_key,
-                    p50=p50,
-                    p80=p80,
-                    sample_count=len(values_sorted),
-                    method=method,
-                )
                 snapshots.append(
                     {
                         "bucket_key": bucket_key,
@@ -128,6 +165,11 @@ class EstimatorService:
                         "method": method,
                     }
                 )
+        self.db.store_estimate_snapshots(snapshots)
+        self._last_fingerprint = fingerprint
+        self._last_snapshots = [dict(row) for row in snapshots]
+        # Only the audit event and snapshot rows were written since the items were read.
+        self._remember_exclusions(exclusions)
         return snapshots
 
     def predict(self, item: dict[str, Any]) -> dict[str, Any]:
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timezone
 from pathlib import Path
 
 from pm_bot.control_plane.db.db import OrchestratorDB
+from pm_bot.shared.settings import get_storage_settings
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class ReportingService:
-    def __init__(self, db: OrchestratorDB, reports_dir: str | Path = "reports") -> None:
+    def __init__(
+        self,
+        db: OrchestratorDB,
+        reports_dir: str | Path | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
         self.db = db
-        self.reports_dir = Path(reports_dir)
+        self._clock = clock or _utc_now
+        self.reports_dir = Path(
+            reports_dir if reports_dir is not None else get_storage_settings().reports_dir
+        )
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
     def _metric_counts(self) -> dict[str, int]:
@@ -386,7 +400,7 @@ class ReportingService:
             }
         )
         return {
-            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "generated_at": self._clock().isoformat(timespec="seconds"),
             "audit_snapshot": {
                 "event_count": len(audit_events),
                 "first_event_id": int(audit_events[0]["id"]) if audit_events else None,
@@ -9,6 +9,7 @@ from pm_bot.control_plane.orchestration.runner_adapters.manual import ManualRunn
 from pm_bot.control_plane.orchestration.runner_adapters.provider_stub import (
     ProviderStubRunnerAdapter,
 )
+from pm_bot.shared.settings import StorageSettings
 
 
 def registered_runner_adapters(
@@ -24,7 +25,9 @@ def registered_runner_adapters(
         checkpointer_module = importlib.import_module(
             "pm_bot.execution_plane.langgraph.checkpointer"
         )
-        checkpointer = checkpointer_module.FsDbCheckpointer(metadata_store=db)
+        checkpointer = checkpointer_module.FsDbCheckpointer(
+            metadata_store=db, base_dir=StorageSettings.from_env().checkpoint_dir
+        )
         langgraph = adapter_module.LangGraphRunnerAdapter(
             audit_sink=db,
             interrupt_store=db,
@@ -53,10 +56,13 @@ def default_runner_adapter_name(
     env: dict[str, str] | None = None,
     *,
     adapters: dict[str, Any] | None = None,
+    configured: str | None = None,
 ) -> str:
     env_map = env or os.environ
     available = adapters or build_runner_adapters_from_env(env_map)
-    configured = str(env_map.get("PM_BOT_RUNNER_DEFAULT_ADAPTER", "")).strip()
+    if configured is None:
+        configured = str(env_map.get("PM_BOT_RUNNER_DEFAULT_ADAPTER", ""))
+    configured = configured.strip()
     if configured and configured in available:
         return configured
     return ManualRunnerAdapter.name
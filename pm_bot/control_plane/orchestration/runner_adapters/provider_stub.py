@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from pm_bot.control_plane.orchestration.runner import RunnerPollResult, RunnerSubmitResult
@@ -16,6 +17,7 @@ _NORMALIZED_FAILURE_CODES: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=32)
 def normalize_provider_failure(reason_code: str) -> str:
     """Map provider-native failure reasons to deterministic policy-safe codes."""
 
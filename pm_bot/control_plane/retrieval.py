@@ -48,9 +48,7 @@ class StubRetriever:
     """No-op retriever implementation for local development and tests."""
 
     def embed(self, text: str) -> list[float]:
-        if not text:
-            return [0.0]
-        # Deterministic stub: encode text length as a single-dimensional vector.
+        # Deterministic stub: encode text length as a single-dimensional vector ([0.0] if empty).
         return [float(len(text))]
 
     def upsert(self, chunks: list[ChunkUpsert]) -> None:
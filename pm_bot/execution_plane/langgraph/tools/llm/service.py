@@ -17,6 +17,9 @@ from pm_bot.execution_plane.langgraph.tools.llm.providers import (
 )
 from pm_bot.execution_plane.langgraph.tools.llm.registry import get_capability_definition
 
+# Providers are stateless, so the default map is built once and shared across calls.
+_DEFAULT_PROVIDERS: dict[str, LLMProvider] = {"local": LocalLLMProvider()}
+
 
 class CapabilityOutputValidationError(ValueError):
     """Raised when a provider output is not valid JSON for a capability contract."""
@@ -243,7 +246,7 @@ def run_capability(
 ) -> dict[str, Any]:
     """Execute a named capability through a normalized provider interface."""
 
-    provider_map = providers or {"local": LocalLLMProvider()}
+    provider_map = providers or _DEFAULT_PROVIDERS
     definition = get_capability_definition(capability_id)
     policy_enforcement = _enforce_capability_policy(
         capability_id=capability_id,
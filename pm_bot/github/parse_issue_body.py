@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -32,14 +33,22 @@ def _to_number_if_possible(value: str) -> float | str:
         return value
 
 
+_TEMPLATE_MAP_PATH = Path(__file__).resolve().parents[1] / "schema" / "template_map.json"
+
+
 def load_template_map() -> dict[str, Any]:
-    path = Path(__file__).resolve().parents[1] / "schema" / "template_map.json"
-    return json.loads(path.read_text())
+    return json.loads(_TEMPLATE_MAP_PATH.read_text())
+
+
+@lru_cache(maxsize=1)
+def _cached_template_map() -> dict[str, Any]:
+    """Parse the bundled template map once; callers must treat the result as read-only."""
+    return load_template_map()
 
 
 def parse_issue_body(markdown: str, item_type: str, title: str = "") -> dict[str, Any]:
     parsed = parse_headings(markdown)
-    template_map = load_template_map()
+    template_map = _cached_template_map()
     if item_type not in template_map:
         raise ValueError(f"Unknown issue type: {item_type}")
 
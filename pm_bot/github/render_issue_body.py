@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import Any
 
+from pm_bot.github.parse_issue_body import _cached_template_map
+
 FIELD_TO_HEADING = {
     "area": "Area",
     "priority": "Priority",
@@ -15,11 +15,7 @@ FIELD_TO_HEADING = {
     "risk": "Risk",
     "blocked_by": "Blocked by",
 }
-
-
-def load_template_map() -> dict[str, Any]:
-    path = Path(__file__).resolve().parents[1] / "schema" / "template_map.json"
-    return json.loads(path.read_text())
+_HEADING_TO_FIELD = {heading: key for key, heading in FIELD_TO_HEADING.items()}
 
 
 def _value_for_heading(item: dict[str, Any], heading: str) -> str:
@@ -27,9 +23,9 @@ def _value_for_heading(item: dict[str, Any], heading: str) -> str:
     if heading in fields:
         return str(fields[heading]).strip()
 
-    for key, mapped_heading in FIELD_TO_HEADING.items():
-        if mapped_heading == heading and item.get(key) not in (None, ""):
-            return str(item[key]).strip()
+    key = _HEADING_TO_FIELD.get(heading)
+    if key is not None and item.get(key) not in (None, ""):
+        return str(item[key]).strip()
 
     if heading == "Child tasks":
         refs = item.get("relationships", {}).get("children_refs", [])
@@ -48,7 +44,7 @@ def _value_for_heading(item: dict[str, Any], heading: str) -> str:
 
 def render_issue_body(item: dict[str, Any]) -> str:
     item_type = item["type"]
-    template_map = load_template_map()
+    template_map = _cached_template_map()
     if item_type not in template_map:
         raise ValueError(f"Unknown issue type: {item_type}")
 
@@ -16,6 +16,7 @@ class StorageSettings:
     artifact_dir: Path
     checkpoint_dir: Path
     repos_dir: Path
+    reports_dir: Path
 
     @classmethod
     def from_env(cls, env: dict[str, str] | None = None) -> "StorageSettings":
@@ -27,12 +28,15 @@ class StorageSettings:
         artifact_dir = Path(source.get("PMBOT_ARTIFACT_DIR", str(data_dir / "artifacts")))
         checkpoint_dir = Path(source.get("PMBOT_CHECKPOINT_DIR", str(data_dir / "checkpoints")))
         repos_dir = Path(source.get("PMBOT_REPOS_DIR", str(data_dir / "repos")))
+        # Weekly reports live in the checkout's reports/ directory, not under the data dir.
+        reports_dir = Path(source.get("PMBOT_REPORTS_DIR", "./reports"))
         return cls(
             data_dir=data_dir,
             sqlite_path=sqlite_path,
             artifact_dir=artifact_dir,
             checkpoint_dir=checkpoint_dir,
             repos_dir=repos_dir,
+            reports_dir=reports_dir,
         )
 
     def ensure_directories(self) -> None:
@@ -41,6 +45,7 @@ class StorageSettings:
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         self.repos_dir.mkdir(parents=True, exist_ok=True)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
 
 
 def get_storage_settings(env: dict[str, str] | None = None) -> StorageSettings:
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -15,12 +18,43 @@ _LINK_PATTERN = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
 _AUDIENCE_PATTERN = re.compile(r"^> \*\*Audience:\*\* .+")
 _DEPTH_PATTERN = re.compile(r"^> \*\*Depth:\*\* (L[0-3])\b")
 _SOT_PATTERN = re.compile(r"^> \*\*Source of truth:\*\* .+")
-
-
-def _iter_markdown_files() -> list[Path]:
-    files = sorted(DOCS_DIR.rglob("*.md"))
-    files.append(STATUS_FILE)
-    return files
+_CHECKLIST_ROW_PATTERN = re.compile(r"^\|\s*(\d+)\s*\|.*$", re.MULTILINE)
+_LEGACY_SCOPE_PATTERN = re.compile(r"^- Scope:", re.MULTILINE)
+
+_REQUIRED_STATUS_HEADINGS = (
+    "## Last updated",
+    "## CI health checklist",
+    "## Current compatibility notes",
+    "## Active change scope bullets",
+)
+_FORBIDDEN_STATUS_SECTIONS = (
+    "## Roadmap status",
+    "## Canonical contract status",
+    "## Current-state deltas",
+    "Roadmap checklist",
+    "Roadmap deliverables status",
+    "Future roadmap",
+    "Quickstart",
+    "How to navigate",
+)
+# Zero-width lookahead so overlapping tokens are all reported from a single scan.
+_FORBIDDEN_STATUS_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(section) for section in _FORBIDDEN_STATUS_SECTIONS) + "))"
+)
+
+
+def _scan_markdown_files(directory: str) -> Iterator[Path]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_markdown_files(entry.path)
+            elif entry.name.endswith(".md"):
+                yield Path(entry.path)
+
+
+@lru_cache(maxsize=1)
+def _iter_markdown_files() -> tuple[Path, ...]:
+    return (*sorted(_scan_markdown_files(str(DOCS_DIR))), STATUS_FILE)
 
 
 def _is_external_link(target: str) -> bool:
@@ -58,9 +92,12 @@ def check_contradiction_workflow_docs() -> list[str]:
         errors.append("docs/maintenance.md missing contradiction-check command entry.")
 
     checklist = CHECKLIST_FILE.read_text(encoding="utf-8")
+    rows: dict[int, str] = {}
+    for match in _CHECKLIST_ROW_PATTERN.finditer(checklist):
+        rows.setdefault(int(match.group(1)), match.group(0))
     for row_number in (11, 12, 13):
-        row_match = re.search(rf"^\|\s*{row_number}\s*\|.*$", checklist, flags=re.MULTILINE)
-        if row_match is None or "☑ done" not in row_match.group(0):
+        row = rows.get(row_number)
+        if row is None or "☑ done" not in row:
             errors.append(
                 "docs/archive/roadmaps/ROADMAP_V4_CHECKLIST.md rows 11-13 must be marked ☑ done."
             )
@@ -84,31 +121,18 @@ def check_status_operability_hygiene() -> list[str]:
         if command not in status_text:
             errors.append(f"STATUS.md missing CI/operability command: {command}")
 
-    required_status_headings = [
-        "## Last updated",
-        "## CI health checklist",
-        "## Current compatibility notes",
-        "## Active change scope bullets",
-    ]
-    for heading in required_status_headings:
+    for heading in _REQUIRED_STATUS_HEADINGS:
         if heading not in status_text:
             errors.append(f"STATUS.md missing required section: {heading}")
 
-    forbidden_status_sections = [
-        "## Roadmap status",
-        "## Canonical contract status",
-        "## Current-state deltas",
-        "Roadmap checklist",
-        "Roadmap deliverables status",
-        "Future roadmap",
-        "Quickstart",
-        "How to navigate",
-    ]
-    for section in forbidden_status_sections:
-        if section in status_text:
+    present_forbidden = {
+        match.group(1) for match in _FORBIDDEN_STATUS_PATTERN.finditer(status_text)
+    }
+    for section in _FORBIDDEN_STATUS_SECTIONS:
+        if section in present_forbidden:
             errors.append(f"STATUS.md contains non-operational guidance section: {section}")
 
-    if re.search(r"^- Scope:", status_text, flags=re.MULTILINE):
+    if _LEGACY_SCOPE_PATTERN.search(status_text):
         errors.append(
             "STATUS.md contains legacy Last updated scope bullets; keep scope bullets only in the active scope section."
         )
@@ -243,9 +267,8 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-if __name__ == "__main__":
-    parser = build_parser()
-    ns = parser.parse_args()
+def main(argv: list[str] | None = None) -> int:
+    ns = build_parser().parse_args(argv)
     if not any(
         (
             ns.check_links,
@@ -260,4 +283,8 @@ if __name__ == "__main__":
         ns.check_status_gates = True
         ns.check_depth_metadata = True
         ns.check_l0_bloat = True
-    raise SystemExit(run_checks(ns))
+    return run_checks(ns)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
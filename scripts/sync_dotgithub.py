@@ -17,8 +17,10 @@ from __future__ import annotations
 import argparse
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 
 OWNER = "phys-sims"
 REPO = ".github"
@@ -37,10 +39,20 @@ FILES = [
 ]
 
 
-def gh_get_contents(path: str, ref: str, token: str) -> bytes:
+def build_session(token: str) -> requests.Session:
+    """One pooled session so concurrent fetches share keep-alive TLS connections."""
+    session = requests.Session()
+    session.headers.update(
+        {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(FILES))
+    session.mount("https://", adapter)
+    return session
+
+
+def gh_get_contents(session: requests.Session, path: str, ref: str) -> bytes:
     url = f"https://api.github.com/repos/{OWNER}/{REPO}/contents/{path}"
-    headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
-    r = requests.get(url, headers=headers, params={"ref": ref}, timeout=30)
+    r = session.get(url, params={"ref": ref}, timeout=30)
     r.raise_for_status()
     data = r.json()
     if isinstance(data, dict) and data.get("encoding") == "base64":
@@ -61,8 +73,10 @@ def main():
     dest = Path(args.dest)
     (dest / "ISSUE_TEMPLATE").mkdir(parents=True, exist_ok=True)
 
-    for f in FILES:
-        content = gh_get_contents(f, args.ref, token)
+    with build_session(token) as session, ThreadPoolExecutor(max_workers=len(FILES)) as pool:
+        contents = list(pool.map(lambda f: gh_get_contents(session, f, args.ref), FILES))
+
+    for f, content in zip(FILES, contents):
         out_path = dest / f.replace(".github/ISSUE_TEMPLATE/", "ISSUE_TEMPLATE/")
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_bytes(content)
@@ -0,0 +1,87 @@
+"""In-process ASGI request helper shared by the HTTP-layer tests."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Coroutine
+from typing import Any
+
+# Scope template copied for every request.
+_BASE_SCOPE: dict[str, Any] = {"type": "http", "query_string": b""}
+
+# Compact separators keep request bodies free of padding bytes.
+_REQUEST_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+class _Receive:
+    """ASGI ``receive`` that delivers the request body once, then empty messages."""
+
+    __slots__ = ("_body",)
+
+    def __init__(self, body: bytes) -> None:
+        self._body: bytes | None = body
+
+    async def __call__(self) -> dict:
+        body, self._body = self._body, None
+        # A fresh message per call, so a callee mutating it cannot leak state across requests.
+        return {"type": "http.request", "body": body or b"", "more_body": False}
+
+
+class _Send:
+    """ASGI ``send`` that records the status and body chunks as messages arrive."""
+
+    __slots__ = ("chunks", "status")
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.chunks: list[bytes] = []
+
+    async def __call__(self, message: dict) -> None:
+        # ASGI requires ``http.response.start`` first, so the first message carries the status
+        # and everything after it is body.
+        if self.status is None:
+            assert message["type"] == "http.response.start", message["type"]
+            self.status = message["status"]
+        else:
+            self.chunks.append(message.get("body", b""))
+
+
+def _drive(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine that never suspends to completion without an event loop.
+
+    ``_Receive``/``_Send`` and the in-process handlers never await real I/O, so the whole
+    request finishes on the first ``send(None)``. Anything that does suspend is a bug here.
+    """
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+    coro.close()
+    raise AssertionError("ASGI app awaited real I/O; the in-process test client cannot drive it")
+
+
+def json_body(payload: Any) -> bytes:
+    """Encode a request payload as a JSON body with one reused encoder."""
+    return _REQUEST_ENCODER.encode(payload).encode("utf-8")
+
+
+def asgi_request(
+    app: Any,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    query_string: bytes = b"",
+) -> tuple[int, dict]:
+    scope = _BASE_SCOPE.copy()
+    scope["method"] = method
+    scope["path"] = path
+    if query_string:
+        scope["query_string"] = query_string
+    send = _Send()
+    _drive(app(scope, _Receive(body), send))
+    if send.status is None:
+        raise AssertionError(f"{method} {path} sent no http.response.start message")
+    # Responses are almost always a single chunk; only join when the body was streamed.
+    chunks = send.chunks
+    payload = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    return send.status, json.loads(payload)
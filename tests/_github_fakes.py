@@ -0,0 +1,45 @@
+"""Scripted GitHub HTTP doubles shared by the connector and repo-sync tests."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class FakeResponse:
+    status_code: int
+    payload: Any
+    headers: dict[str, str] | None = None
+
+    @property
+    def content(self) -> bytes:
+        if self.payload is None:
+            return b""
+        return b"json"
+
+    def json(self) -> Any:
+        return self.payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """HTTP session double that answers each request with the next scripted response."""
+
+    __slots__ = ("calls", "responses")
+
+    def __init__(self, responses: list[FakeResponse]) -> None:
+        self.responses = deque(responses)
+        self.calls: list[dict[str, Any]] = []
+
+    def request(self, **kwargs: Any) -> FakeResponse:
+        self.calls.append(kwargs)
+        if not self.responses:
+            raise AssertionError(
+                f"no scripted response left for {kwargs.get('method')} {kwargs.get('url')}"
+            )
+        return self.responses.popleft()
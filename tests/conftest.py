@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pm_bot.server.app import ASGIServer, ServerApp
+    from pm_bot.server.db import OrchestratorDB
+
+_STORAGE_PATH_OVERRIDES = (
+    "PMBOT_SQLITE_PATH",
+    "PMBOT_ARTIFACT_DIR",
+    "PMBOT_CHECKPOINT_DIR",
+    "PMBOT_REPOS_DIR",
+)
+_STORAGE_PATCH = pytest.StashKey[tuple[pytest.MonkeyPatch, Path]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Point local-first storage and reports at a per-process temp dir instead of the checkout.
+
+    This runs before test modules are collected, so importing ``pm_bot.server.app`` (which
+    builds a module-level ``ASGIServer``) already sees the temp dir. Each xdist worker runs its
+    own configure, so parallel workers never share SQLite files, artifacts, or checkpoints.
+    """
+    data_dir = Path(tempfile.mkdtemp(prefix="pmbot-data-"))
+    mp = pytest.MonkeyPatch()
+    mp.setenv("PMBOT_DATA_DIR", str(data_dir))
+    mp.setenv("PMBOT_REPORTS_DIR", str(data_dir / "reports"))
+    for name in _STORAGE_PATH_OVERRIDES:
+        mp.delenv(name, raising=False)
+    config.stash[_STORAGE_PATCH] = (mp, data_dir)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    patch = config.stash.get(_STORAGE_PATCH, None)
+    if patch is None:
+        return
+    mp, data_dir = patch
+    mp.undo()
+    shutil.rmtree(data_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def _template_db() -> OrchestratorDB:
+    """Empty, fully migrated database built once per session."""
+    from pm_bot.server.db import OrchestratorDB
+
+    return OrchestratorDB()
+
+
+@pytest.fixture
+def orchestrator_db(_template_db: OrchestratorDB) -> OrchestratorDB:
+    """Fresh in-memory database copied from the session template."""
+    return _template_db.clone_in_memory()
+
+
+@pytest.fixture(scope="session")
+def control_plane_py_files() -> tuple[Path, ...]:
+    """Python sources under ``pm_bot/control_plane``, walked once per session."""
+    return tuple(Path("pm_bot/control_plane").rglob("*.py"))
+
+
+@pytest.fixture(scope="module")
+def _module_server_app(_template_db: OrchestratorDB) -> ServerApp:
+    """One ServerApp per test module, on a clone of the session template database.
+
+    Reset between tests by ``server_app``.
+    """
+    from pm_bot.server.app import ServerApp
+
+    return ServerApp(db=_template_db.clone_in_memory())
+
+
+@pytest.fixture
+def server_app(_module_server_app: ServerApp) -> ServerApp:
+    """Module-shared ServerApp with rows and services reset for this test.
+
+    Tests that mutate environment variables read at construction time should build their own
+    ``ServerApp()`` after patching instead.
+    """
+    _module_server_app.reset()
+    return _module_server_app
+
+
+@pytest.fixture
+def asgi_app(server_app: ServerApp) -> ASGIServer:
+    from pm_bot.server.app import ASGIServer
+
+    return ASGIServer(service=server_app)
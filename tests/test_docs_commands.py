@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
+EXPECTED_COMMANDS = (
+    "pytest -q tests/test_server_http_contract.py tests/test_validation.py tests/test_github_connector_api.py",
+    "pytest -q tests/test_runbook_scenarios.py",
+    "pytest -q tests/test_golden_issue_fixtures.py tests/test_reporting.py",
+    "pytest -q tests/test_docs_commands.py",
+    "python scripts/docs_hygiene.py --check-links --check-contradictions --check-status-gates --check-depth-metadata --check-l0-bloat",
+    "pytest -q tests/test_docs_hygiene.py",
+)
 
-def test_qa_matrix_commands_are_listed_in_ci_jobs() -> None:
-    matrix = Path("docs/qa-matrix.md").read_text(encoding="utf-8")
-    workflow = Path(".github/workflows/ci.yml").read_text(encoding="utf-8")
 
-    expected_commands = [
-        "pytest -q tests/test_server_http_contract.py tests/test_validation.py tests/test_github_connector_api.py",
-        "pytest -q tests/test_runbook_scenarios.py",
-        "pytest -q tests/test_golden_issue_fixtures.py tests/test_reporting.py",
-        "pytest -q tests/test_docs_commands.py",
-        "python scripts/docs_hygiene.py --check-links --check-contradictions --check-status-gates --check-depth-metadata --check-l0-bloat",
-        "pytest -q tests/test_docs_hygiene.py",
-    ]
+@cache
+def _read(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def test_qa_matrix_commands_are_listed_in_ci_jobs() -> None:
+    matrix = _read("docs/qa-matrix.md")
+    workflow = _read(".github/workflows/ci.yml")
 
-    for command in expected_commands:
-        assert command in matrix
-        assert command in workflow
+    assert [command for command in EXPECTED_COMMANDS if command not in matrix] == []
+    assert [command for command in EXPECTED_COMMANDS if command not in workflow] == []
@@ -1,21 +1,58 @@
 from __future__ import annotations
 
-import subprocess
+import importlib.util
+from pathlib import Path
 
+import pytest
 
-def test_docs_hygiene_script_passes() -> None:
-    result = subprocess.run(
+_SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "docs_hygiene.py"
+_spec = importlib.util.spec_from_file_location("docs_hygiene", _SCRIPT_PATH)
+assert _spec is not None and _spec.loader is not None
+docs_hygiene = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(docs_hygiene)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
         [
-            "python",
-            "scripts/docs_hygiene.py",
             "--check-links",
             "--check-contradictions",
             "--check-status-gates",
             "--check-depth-metadata",
             "--check-l0-bloat",
         ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0, result.stdout + result.stderr
+        [],
+    ],
+    ids=["explicit-flags", "default-all-checks"],
+)
+def test_docs_hygiene_script_passes(argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+    exit_code = docs_hygiene.main(argv)
+    out = capsys.readouterr().out
+    assert exit_code == 0, out
+    assert "Docs hygiene checks passed." in out
+
+
+@pytest.mark.parametrize(
+    ("heading", "replacement"),
+    [
+        ("## CI health checklist", "## CI health checklist (local)"),
+        ("## Current compatibility notes", "### Current compatibility notes"),
+    ],
+    ids=["trailing-qualifier", "different-level"],
+)
+def test_status_required_sections_match_as_substrings(
+    heading: str,
+    replacement: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    status_text = docs_hygiene.STATUS_FILE.read_text(encoding="utf-8")
+    assert heading in status_text
+    status_file = tmp_path / "STATUS.md"
+    status_file.write_text(status_text.replace(heading, replacement), encoding="utf-8")
+    monkeypatch.setattr(docs_hygiene, "STATUS_FILE", status_file)
+
+    errors = docs_hygiene.check_status_operability_hygiene()
+
+    assert not [error for error in errors if "missing required section" in error], errors
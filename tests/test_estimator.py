@@ -1,3 +1,7 @@
+from typing import Any
+
+import pytest
+
 from pm_bot.server.db import OrchestratorDB
 from pm_bot.server.estimator import EstimatorService
 
@@ -17,8 +21,8 @@ def _upsert(db: OrchestratorDB, issue_ref: str, **payload: object) -> None:
     )
 
 
-def test_predict_fallback_path_when_exact_bucket_sparse() -> None:
-    db = OrchestratorDB()
+def test_predict_fallback_path_when_exact_bucket_sparse(orchestrator_db: OrchestratorDB) -> None:
+    db = orchestrator_db
     estimator = EstimatorService(db=db)
 
     _upsert(db, "r#1", actual_hrs=4.0, size="m")
@@ -35,8 +39,8 @@ def test_predict_fallback_path_when_exact_bucket_sparse() -> None:
     assert prediction["fallback_path"][1]["reason"] == "selected"
 
 
-def test_predict_uses_configurable_bucket_thresholds() -> None:
-    db = OrchestratorDB()
+def test_predict_uses_configurable_bucket_thresholds(orchestrator_db: OrchestratorDB) -> None:
+    db = orchestrator_db
     estimator = EstimatorService(
         db=db,
         min_samples_by_bucket={"type:task|area:platform|size:m": 2},
@@ -54,8 +58,8 @@ def test_predict_uses_configurable_bucket_thresholds() -> None:
     assert prediction["fallback_path"][0]["selected"] is True
 
 
-def test_quantiles_are_deterministic_nearest_rank() -> None:
-    db = OrchestratorDB()
+def test_quantiles_are_deterministic_nearest_rank(orchestrator_db: OrchestratorDB) -> None:
+    db = orchestrator_db
     estimator = EstimatorService(db=db, default_min_samples=1)
 
     for idx, hrs in enumerate([1.0, 2.0, 3.0, 4.0, 5.0], start=1):
@@ -69,8 +73,8 @@ def test_quantiles_are_deterministic_nearest_rank() -> None:
     assert prediction["method"] == "nearest-rank"
 
 
-def test_historical_exclusion_reasons_are_recorded() -> None:
-    db = OrchestratorDB()
+def test_historical_exclusion_reasons_are_recorded(orchestrator_db: OrchestratorDB) -> None:
+    db = orchestrator_db
     estimator = EstimatorService(db=db)
 
     _upsert(db, "r#1", actual_hrs=2.0)
@@ -89,3 +93,124 @@ def test_historical_exclusion_reasons_are_recorded() -> None:
     event = db.list_audit_events("estimator_samples_excluded")[-1]["payload"]
     assert event["excluded_total"] == 3
     assert event["reasons"] == estimator.exclusion_reasons()
+
+
+def test_exclusion_reasons_are_available_before_any_snapshot_build(
+    orchestrator_db: OrchestratorDB,
+) -> None:
+    db = orchestrator_db
+    estimator = EstimatorService(db=db)
+
+    _upsert(db, "r#1", actual_hrs=2.0)
+    _upsert(db, "r#2", actual_hrs=None)
+    _upsert(db, "r#3", actual_hrs=-1.0)
+
+    assert estimator.exclusion_reasons() == {
+        "missing_actual_hrs": 1,
+        "non_positive_actual_hrs": 1,
+    }
+    assert db.latest_estimate_snapshots() == []
+    assert db.list_audit_events("estimator_samples_excluded") == []
+
+
+def test_exclusion_reasons_reflect_current_items_after_a_build(
+    orchestrator_db: OrchestratorDB,
+) -> None:
+    db = orchestrator_db
+    estimator = EstimatorService(db=db)
+
+    _upsert(db, "r#1", actual_hrs=2.0)
+    _upsert(db, "r#2", actual_hrs=None)
+    estimator.build_snapshots()
+
+    _upsert(db, "r#3", actual_hrs=0)
+
+    assert estimator.exclusion_reasons() == {
+        "missing_actual_hrs": 1,
+        "non_positive_actual_hrs": 1,
+    }
+
+
+def test_exclusion_reasons_reuse_counts_until_work_items_change(
+    orchestrator_db: OrchestratorDB, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db = orchestrator_db
+    estimator = EstimatorService(db=db)
+    _upsert(db, "r#1", actual_hrs=2.0)
+    _upsert(db, "r#2", actual_hrs=None)
+    estimator.build_snapshots()
+
+    scans = 0
+    list_work_items = db.list_work_items
+
+    def counting_list_work_items() -> list[dict[str, Any]]:
+        nonlocal scans
+        scans += 1
+        return list_work_items()
+
+    monkeypatch.setattr(db, "list_work_items", counting_list_work_items)
+
+    assert estimator.exclusion_reasons() == {"missing_actual_hrs": 1}
+    assert estimator.exclusion_reasons() == {"missing_actual_hrs": 1}
+    assert scans == 0
+
+    _upsert(db, "r#3", actual_hrs=None)
+
+    assert estimator.exclusion_reasons() == {"missing_actual_hrs": 2}
+    assert estimator.exclusion_reasons() == {"missing_actual_hrs": 2}
+    assert scans == 1
+
+
+def test_build_snapshots_skips_rebuild_when_samples_are_unchanged(
+    orchestrator_db: OrchestratorDB,
+) -> None:
+    db = orchestrator_db
+    estimator = EstimatorService(db=db, default_min_samples=1)
+
+    _upsert(db, "r#1", actual_hrs=2.0)
+    _upsert(db, "r#2", actual_hrs=4.0)
+
+    def _stored_count() -> int:
+        return db.conn.execute("SELECT COUNT(*) FROM estimate_snapshots").fetchone()[0]
+
+    first = estimator.build_snapshots()
+    stored = _stored_count()
+    assert estimator.build_snapshots() == first
+    assert _stored_count() == stored
+
+    _upsert(db, "r#3", actual_hrs=9.0)
+    rebuilt = estimator.build_snapshots()
+
+    assert _stored_count() == stored + len(rebuilt)
+    assert estimator.predict({"type": "task", "area": "platform", "size": "m"})["p80"] == 9.0
+
+
+def test_build_snapshots_restores_snapshots_removed_from_the_database(
+    orchestrator_db: OrchestratorDB,
+) -> None:
+    db = orchestrator_db
+    estimator = EstimatorService(db=db, default_min_samples=1)
+
+    _upsert(db, "r#1", actual_hrs=2.0)
+    _upsert(db, "r#2", actual_hrs=4.0)
+    first = estimator.build_snapshots()
+
+    db.conn.execute("DELETE FROM estimate_snapshots")
+    db.conn.commit()
+
+    assert estimator.build_snapshots() == first
+    assert len(db.latest_estimate_snapshots()) == len(first)
+    assert estimator.predict({"type": "task", "area": "platform", "size": "m"})["p80"] == 4.0
+
+
+def test_quantiles_do_not_depend_on_insertion_order(orchestrator_db: OrchestratorDB) -> None:
+    db = orchestrator_db
+    estimator = EstimatorService(db=db, default_min_samples=1)
+
+    for idx, hrs in enumerate([5.0, 1.0, 4.0, 2.0, 3.0], start=1):
+        _upsert(db, f"r#{idx}", actual_hrs=hrs, size="m")
+
+    snapshots = {row["bucket_key"]: row for row in estimator.build_snapshots()}
+
+    assert snapshots["global"]["p50"] == 3.0
+    assert snapshots["global"]["p80"] == 4.0
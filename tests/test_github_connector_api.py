@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-
 import pytest
+from _github_fakes import FakeResponse, FakeSession
 
 from pm_bot.server.github_auth import load_github_auth_from_env
 from pm_bot.server.github_connector import (
@@ -15,37 +13,10 @@ from pm_bot.server.github_connector import (
 from pm_bot.server.github_connector_api import GitHubAPIConnector
 from pm_bot.server.github_connector_inmemory import InMemoryGitHubConnector
 
-
-@dataclass
-class FakeResponse:
-    status_code: int
-    payload: Any
-    headers: dict[str, str] | None = None
-
-    @property
-    def content(self) -> bytes:
-        if self.payload is None:
-            return b""
-        return b"json"
-
-    def json(self) -> Any:
-        return self.payload
-
-    def raise_for_status(self) -> None:
-        if self.status_code >= 400:
-            raise RuntimeError(f"HTTP {self.status_code}")
-
-
-class FakeSession:
-    def __init__(self, responses: list[FakeResponse]) -> None:
-        self.responses = responses
-        self.calls: list[dict[str, Any]] = []
-
-    def request(self, **kwargs: Any) -> FakeResponse:
-        self.calls.append(kwargs)
-        if not self.responses:
-            raise RuntimeError("No fake response left")
-        return self.responses.pop(0)
+_READ_ENV = {"PM_BOT_GITHUB_READ_TOKEN": "read-token"}
+_WRITE_ENV = {"PM_BOT_GITHUB_WRITE_TOKEN": "write-token"}
+_READ_WRITE_ENV = {**_READ_ENV, **_WRITE_ENV}
+_READ_SHARED_ENV = {**_READ_ENV, "PM_BOT_GITHUB_TOKEN": "shared-token"}
 
 
 def test_build_connector_from_env_defaults_to_inmemory() -> None:
@@ -75,12 +46,7 @@ def test_build_connector_from_env_uses_env_allowed_repos_when_not_explicit() ->
 
 
 def test_auth_loads_read_write_tokens_with_shared_fallback() -> None:
-    auth = load_github_auth_from_env(
-        {
-            "PM_BOT_GITHUB_READ_TOKEN": "read-token",
-            "PM_BOT_GITHUB_TOKEN": "shared-token",
-        }
-    )
+    auth = load_github_auth_from_env(_READ_SHARED_ENV)
     assert auth.read_token == "read-token"
     assert auth.write_token == "shared-token"
 
@@ -97,12 +63,7 @@ def test_api_connector_create_update_list_and_link() -> None:
     )
     connector = GitHubAPIConnector(
         allowed_repos={"phys-sims/phys-pipeline"},
-        auth=load_github_auth_from_env(
-            {
-                "PM_BOT_GITHUB_READ_TOKEN": "read-token",
-                "PM_BOT_GITHUB_WRITE_TOKEN": "write-token",
-            }
-        ),
+        auth=load_github_auth_from_env(_READ_WRITE_ENV),
         session=session,
     )
 
@@ -145,12 +106,15 @@ def test_api_connector_create_update_list_and_link() -> None:
     auth_headers = [call["headers"].get("Authorization") for call in session.calls]
     assert auth_headers[0] == "Bearer read-token"
     assert auth_headers[2] == "Bearer write-token"
+    assert session.calls[0]["data"] is None
+    assert session.calls[2]["data"] == b'{"title":"Two"}'
+    assert session.calls[2]["headers"]["Content-Type"] == "application/json"
 
 
 def test_api_connector_raises_retryable_for_rate_limit_and_5xx() -> None:
     connector = GitHubAPIConnector(
         allowed_repos={"phys-sims/phys-pipeline"},
-        auth=load_github_auth_from_env({"PM_BOT_GITHUB_WRITE_TOKEN": "write-token"}),
+        auth=load_github_auth_from_env(_WRITE_ENV),
         session=FakeSession(
             [
                 FakeResponse(403, {"message": "API rate limit exceeded"}, {"Retry-After": "2"}),
@@ -173,7 +137,7 @@ def test_api_connector_raises_retryable_for_rate_limit_and_5xx() -> None:
 
     connector_5xx = GitHubAPIConnector(
         allowed_repos={"phys-sims/phys-pipeline"},
-        auth=load_github_auth_from_env({"PM_BOT_GITHUB_WRITE_TOKEN": "write-token"}),
+        auth=load_github_auth_from_env(_WRITE_ENV),
         session=FakeSession([FakeResponse(503, {"message": "unavailable"})]),
     )
     with pytest.raises(RetryableGitHubError) as exc_5xx:
@@ -210,7 +174,7 @@ def test_api_connector_normalizes_sub_issues_and_dependencies() -> None:
     )
     connector = GitHubAPIConnector(
         allowed_repos={"phys-sims/phys-pipeline"},
-        auth=load_github_auth_from_env({"PM_BOT_GITHUB_READ_TOKEN": "read-token"}),
+        auth=load_github_auth_from_env(_READ_ENV),
         session=session,
     )
 
@@ -257,7 +221,7 @@ def test_api_connector_inbox_items_are_cached_and_deterministic() -> None:
     )
     connector = GitHubAPIConnector(
         allowed_repos={"phys-sims/phys-pipeline"},
-        auth=load_github_auth_from_env({"PM_BOT_GITHUB_READ_TOKEN": "read-token"}),
+        auth=load_github_auth_from_env(_READ_ENV),
         session=session,
         cache_ttl_s=60,
     )
@@ -275,3 +239,11 @@ def test_api_connector_inbox_items_are_cached_and_deterministic() -> None:
     assert diag_1["cache"]["hit"] is False
     assert diag_2["cache"]["hit"] is True
     assert len(session.calls) == 1
+
+    items_1[0]["title"] = "mutated"
+    items_2.clear()
+    items_3, _ = connector.list_inbox_items(
+        actor="octo", labels=["needs-human"], repos=["phys-sims/phys-pipeline"]
+    )
+    assert [item["title"] for item in items_3] == ["Needs review"]
+    assert len(session.calls) == 1
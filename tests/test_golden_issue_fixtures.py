@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from pm_bot.github.parse_issue_body import parse_issue_body
 from pm_bot.github.render_issue_body import render_issue_body
@@ -9,9 +11,19 @@ from pm_bot.github.render_issue_body import render_issue_body
 FIXTURES = Path(__file__).parent / "fixtures" / "golden_issue_flows"
 
 
+@cache
+def _read_text(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+@cache
+def _read_json(name: str) -> Any:
+    return json.loads(_read_text(name))
+
+
 def test_feature_issue_body_matches_golden_parse_fixture() -> None:
-    markdown = (FIXTURES / "feature_issue_body.md").read_text(encoding="utf-8")
-    expected = json.loads((FIXTURES / "feature_expected_parse.json").read_text(encoding="utf-8"))
+    markdown = _read_text("feature_issue_body.md")
+    expected = _read_json("feature_expected_parse.json")
 
     parsed = parse_issue_body(
         markdown, item_type="feature", title="Feature: deterministic parser fixtures"
@@ -21,8 +33,8 @@ def test_feature_issue_body_matches_golden_parse_fixture() -> None:
 
 
 def test_feature_issue_body_matches_golden_render_fixture() -> None:
-    parsed = json.loads((FIXTURES / "feature_expected_parse.json").read_text(encoding="utf-8"))
-    expected = (FIXTURES / "feature_expected_render.md").read_text(encoding="utf-8")
+    parsed = _read_json("feature_expected_parse.json")
+    expected = _read_text("feature_expected_render.md")
 
     rendered = render_issue_body(parsed)
 
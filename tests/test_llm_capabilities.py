@@ -12,6 +12,16 @@ from pm_bot.server.llm.providers.base import LLMRequest, LLMResponse
 from pm_bot.server.llm.service import CapabilityOutputValidationError, run_capability
 
 
+def _fake_response(provider: str, raw_text: str) -> LLMResponse:
+    return LLMResponse(
+        output={},
+        model="fake",
+        provider=provider,
+        usage={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
+        raw_text=raw_text,
+    )
+
+
 def test_run_capability_report_ir_draft_with_local_provider() -> None:
     result = run_capability(
         REPORT_IR_DRAFT,
@@ -49,26 +59,14 @@ class _InvalidJSONProvider:
     name = "invalid-json"
 
     def run(self, request: LLMRequest) -> LLMResponse:
-        return LLMResponse(
-            output={},
-            model="fake",
-            provider=self.name,
-            usage={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
-            raw_text="not-json",
-        )
+        return _fake_response(self.name, "not-json")
 
 
 class _SchemaViolationProvider:
     name = "schema-violation"
 
     def run(self, request: LLMRequest) -> LLMResponse:
-        return LLMResponse(
-            output={},
-            model="fake",
-            provider=self.name,
-            usage={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
-            raw_text='{"draft": {"schema_version": "wrong"}}',
-        )
+        return _fake_response(self.name, '{"draft": {"schema_version": "wrong"}}')
 
 
 def test_run_capability_rejects_non_json_model_output() -> None:
@@ -78,7 +76,7 @@ def test_run_capability_rejects_non_json_model_output() -> None:
             input_payload={"natural_text": "- item", "org": "phys-sims", "repos": []},
             context={"provider": "invalid-json"},
             policy={},
-            providers={"invalid-json": _InvalidJSONProvider()},
+            providers=_PROVIDERS,
         )
 
     error = exc_info.value.as_dict()
@@ -92,44 +90,47 @@ def test_run_capability_rejects_schema_non_conforming_output() -> None:
             input_payload={"natural_text": "- item", "org": "phys-sims", "repos": []},
             context={"provider": "schema-violation"},
             policy={},
-            providers={"schema-violation": _SchemaViolationProvider()},
+            providers=_PROVIDERS,
         )
 
     error_codes = [row["code"] for row in exc_info.value.as_dict()["validation"]["errors"]]
     assert "SCHEMA_ENUM" in error_codes
 
 
+_READ_ONLY_ADVICE_RAW = (
+    '{"summary":"s","recommendations":[{"id":"r1","title":"t","priority":"P1"}]}'
+)
+_MUTATION_PROPOSAL_RAW = (
+    '{"schema_version":"changeset_bundle_proposal/v1","bundle":{'
+    '"bundle_id":"bundle-1","requires_human_approval":true,'
+    '"changesets":[{"operation":"update_issue","repo":"phys-sims/pm-bot",'
+    '"target_ref":"#1","idempotency_key":"k1","payload":{"body":"x"}}]}}'
+)
+
+
 class _ReadOnlyAdviceProvider:
     name = "read-only-advice"
 
     def run(self, request: LLMRequest) -> LLMResponse:
-        return LLMResponse(
-            output={},
-            model="fake",
-            provider=self.name,
-            usage={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
-            raw_text=(
-                '{"summary":"s","recommendations":[{"id":"r1","title":"t","priority":"P1"}]}'
-            ),
-        )
+        return _fake_response(self.name, _READ_ONLY_ADVICE_RAW)
 
 
 class _MutationProposalProvider:
     name = "mutation-proposal"
 
     def run(self, request: LLMRequest) -> LLMResponse:
-        return LLMResponse(
-            output={},
-            model="fake",
-            provider=self.name,
-            usage={"input_tokens": 1, "output_tokens": 1, "total_tokens": 2},
-            raw_text=(
-                '{"schema_version":"changeset_bundle_proposal/v1","bundle":{'
-                '"bundle_id":"bundle-1","requires_human_approval":true,'
-                '"changesets":[{"operation":"update_issue","repo":"phys-sims/pm-bot",'
-                '"target_ref":"#1","idempotency_key":"k1","payload":{"body":"x"}}]}}'
-            ),
-        )
+        return _fake_response(self.name, _MUTATION_PROPOSAL_RAW)
+
+
+_PROVIDERS = {
+    provider.name: provider
+    for provider in (
+        _InvalidJSONProvider(),
+        _SchemaViolationProvider(),
+        _ReadOnlyAdviceProvider(),
+        _MutationProposalProvider(),
+    )
+}
 
 
 def test_read_only_capability_allows_low_approval_policy() -> None:
@@ -138,57 +139,64 @@ def test_read_only_capability_allows_low_approval_policy() -> None:
         input_payload={"board_snapshot": []},
         context={"provider": "read-only-advice"},
         policy={"approval_level": "low"},
-        providers={"read-only-advice": _ReadOnlyAdviceProvider()},
+        providers=_PROVIDERS,
     )
 
     assert result["capability_class"] == "read_only_advice"
     assert result["policy_enforcement"]["approval_level"] == "low"
 
 
-def test_mutation_capability_denies_without_changeset_bundle_policy_flag() -> None:
-    with pytest.raises(
-        ValueError,
-        match=(
-            "capability_policy_denied:issue_adjustment_proposal:changeset_bundle_proposal_required"
-        ),
-    ):
-        run_capability(
+@pytest.mark.parametrize(
+    ("capability", "input_payload", "provider", "policy", "denial"),
+    [
+        pytest.param(
             ISSUE_ADJUSTMENT_PROPOSAL,
-            input_payload={"issue_ref": "#1"},
-            context={"provider": "mutation-proposal"},
-            policy={"require_human_approval": True},
-            providers={"mutation-proposal": _MutationProposalProvider()},
-        )
-
-
-def test_mutation_capability_denies_when_human_approval_is_disabled() -> None:
-    with pytest.raises(
-        ValueError,
-        match="capability_policy_denied:issue_adjustment_proposal:human_approval_required",
-    ):
-        run_capability(
+            {"issue_ref": "#1"},
+            "mutation-proposal",
+            {"require_human_approval": True},
+            "issue_adjustment_proposal:changeset_bundle_proposal_required",
+            id="mutation-without-changeset-bundle-flag",
+        ),
+        pytest.param(
             ISSUE_ADJUSTMENT_PROPOSAL,
-            input_payload={"issue_ref": "#1"},
-            context={"provider": "mutation-proposal"},
-            policy={
-                "proposal_output_changeset_bundle": True,
-                "require_human_approval": False,
-            },
-            providers={"mutation-proposal": _MutationProposalProvider()},
-        )
-
-
-def test_capability_policy_denies_direct_github_write_bypass_attempt() -> None:
-    with pytest.raises(
-        ValueError,
-        match="capability_policy_denied:board_strategy_review:direct_github_writes_forbidden",
-    ):
-        run_capability(
+            {"issue_ref": "#1"},
+            "mutation-proposal",
+            {"proposal_output_changeset_bundle": True, "require_human_approval": False},
+            "issue_adjustment_proposal:human_approval_required",
+            id="mutation-with-human-approval-disabled",
+        ),
+        pytest.param(
             BOARD_STRATEGY_REVIEW,
-            input_payload={"board_snapshot": []},
-            context={"provider": "read-only-advice"},
-            policy={"allow_direct_github_writes": True},
-            providers={"read-only-advice": _ReadOnlyAdviceProvider()},
+            {"board_snapshot": []},
+            "read-only-advice",
+            {"allow_direct_github_writes": True},
+            "board_strategy_review:direct_github_writes_forbidden",
+            id="direct-github-write-bypass-attempt",
+        ),
+        pytest.param(
+            ISSUE_REPLANNER,
+            {"repo": "phys-sims/pm-bot", "diff": {}},
+            "mutation-proposal",
+            {"require_human_approval": True},
+            "issue_replanner:changeset_bundle_proposal_required",
+            id="issue-replanner-mutation-gates",
+        ),
+    ],
+)
+def test_capability_policy_denials(
+    capability: str,
+    input_payload: dict[str, object],
+    provider: str,
+    policy: dict[str, object],
+    denial: str,
+) -> None:
+    with pytest.raises(ValueError, match=f"capability_policy_denied:{denial}"):
+        run_capability(
+            capability,
+            input_payload=input_payload,
+            context={"provider": provider},
+            policy=policy,
+            providers=_PROVIDERS,
         )
 
 
@@ -201,23 +209,9 @@ def test_mutation_capability_accepts_changeset_bundle_contract_when_policy_allow
             "proposal_output_changeset_bundle": True,
             "require_human_approval": True,
         },
-        providers={"mutation-proposal": _MutationProposalProvider()},
+        providers=_PROVIDERS,
     )
 
     assert result["capability_class"] == "mutation_proposal"
     assert result["policy_enforcement"]["requires_human_approval"] is True
     assert result["output"]["schema_version"] == "changeset_bundle_proposal/v1"
-
-
-def test_issue_replanner_requires_mutation_policy_gates() -> None:
-    with pytest.raises(
-        ValueError,
-        match="capability_policy_denied:issue_replanner:changeset_bundle_proposal_required",
-    ):
-        run_capability(
-            ISSUE_REPLANNER,
-            input_payload={"repo": "phys-sims/pm-bot", "diff": {}},
-            context={"provider": "mutation-proposal"},
-            policy={"require_human_approval": True},
-            providers={"mutation-proposal": _MutationProposalProvider()},
-        )
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from pm_bot.control_plane.artifacts.store import FilesystemBlobStore
 from pm_bot.control_plane.db.db import OrchestratorDB
 from pm_bot.shared.settings import get_storage_settings
 
@@ -11,6 +12,7 @@ def test_storage_settings_create_local_first_directories(tmp_path: Path) -> None
         "PMBOT_ARTIFACT_DIR": str(tmp_path / "data" / "artifacts"),
         "PMBOT_CHECKPOINT_DIR": str(tmp_path / "data" / "checkpoints"),
         "PMBOT_REPOS_DIR": str(tmp_path / "data" / "repos"),
+        "PMBOT_REPORTS_DIR": str(tmp_path / "reports"),
     }
 
     settings = get_storage_settings(env)
@@ -20,6 +22,7 @@ def test_storage_settings_create_local_first_directories(tmp_path: Path) -> None
     assert settings.artifact_dir.exists()
     assert settings.checkpoint_dir.exists()
     assert settings.repos_dir.exists()
+    assert settings.reports_dir.exists()
 
 
 def test_sqlite_connection_uses_wal_and_busy_timeout(tmp_path: Path) -> None:
@@ -44,3 +47,78 @@ def test_rag_metadata_tables_exist(tmp_path: Path) -> None:
     assert "chunks" in table_names
     assert "embedding_records" in table_names
     assert "ingestion_jobs" in table_names
+
+
+def test_clone_in_memory_copies_schema_and_rows_independently() -> None:
+    template = OrchestratorDB()
+    template.append_audit_event("seeded", {"n": 1})
+
+    clone = template.clone_in_memory()
+    clone.append_audit_event("seeded", {"n": 2})
+
+    assert [event["payload"]["n"] for event in template.list_audit_events("seeded")] == [1]
+    assert [event["payload"]["n"] for event in clone.list_audit_events("seeded")] == [1, 2]
+    assert int(clone.conn.execute("PRAGMA busy_timeout").fetchone()[0]) == 5000
+
+
+def test_reset_clears_rows_and_restores_seeded_defaults() -> None:
+    db = OrchestratorDB()
+    db.append_audit_event("seeded", {"n": 1})
+    db.conn.execute("INSERT INTO workspaces (id, name) VALUES (2, 'extra')")
+    db.conn.commit()
+
+    db.reset()
+
+    assert db.list_audit_events("seeded") == []
+    workspaces = db.conn.execute("SELECT id, name FROM workspaces").fetchall()
+    assert [tuple(row) for row in workspaces] == [(1, "default")]
+    assert int(db.conn.execute("PRAGMA foreign_keys").fetchone()[0]) == 1
+
+
+def test_filesystem_blob_store_round_trips_file_uris(tmp_path: Path) -> None:
+    store = FilesystemBlobStore(tmp_path / "artifacts")
+
+    uri = store.put("run-1.changeset_bundle.json", b'{"ok":true}')
+
+    assert uri == (tmp_path / "artifacts" / "run-1.changeset_bundle.json").resolve().as_uri()
+    assert store.get(uri) == b'{"ok":true}'
+    assert store.get("mem://run-1.changeset_bundle.json") is None
+    assert store.get((tmp_path / "missing.json").as_uri()) is None
+
+
+def test_append_audit_events_preserves_order_across_insert_chunks(
+    orchestrator_db: OrchestratorDB,
+) -> None:
+    orchestrator_db.append_audit_events([("bulk", {"n": n}) for n in range(700)])
+
+    events = orchestrator_db.list_audit_events("bulk")
+
+    assert [event["payload"]["n"] for event in events] == list(range(700))
+
+
+def test_in_memory_databases_match_file_schema_and_stay_independent(tmp_path: Path) -> None:
+    first = OrchestratorDB()
+    first.append_audit_event("seeded", {"n": 1})
+    second = OrchestratorDB()
+    on_disk = OrchestratorDB(tmp_path / "control_plane" / "pm_bot.sqlite")
+
+    schema_sql = "SELECT type, name, sql FROM sqlite_master ORDER BY type, name"
+    assert [tuple(row) for row in second.conn.execute(schema_sql)] == [
+        tuple(row) for row in on_disk.conn.execute(schema_sql)
+    ]
+    assert second.list_audit_events("seeded") == []
+    assert [tuple(row) for row in second.conn.execute("SELECT id, name FROM workspaces")] == [
+        (1, "default")
+    ]
+    assert int(second.conn.execute("PRAGMA foreign_keys").fetchone()[0]) == 1
+
+
+def test_list_audit_events_limit_returns_newest_in_order(orchestrator_db: OrchestratorDB) -> None:
+    orchestrator_db.append_audit_events(
+        [("attempt", {"n": n}) for n in range(5)] + [("other", {"n": 99})]
+    )
+
+    newest = orchestrator_db.list_audit_events("attempt", limit=2)
+
+    assert [event["payload"]["n"] for event in newest] == [3, 4]
+    assert len(orchestrator_db.list_audit_events(limit=3)) == 3
@@ -1,4 +1,14 @@
-import json
+import pytest
+from _asgi_client import asgi_request, json_body
+
+_DENIED_CONTEXT_PROPOSE_BODY = json_body(
+    {
+        "operation": "create_issue",
+        "repo": "phys-sims/phys-pipeline",
+        "payload": {"title": "Denied context"},
+        "org": "other-org",
+    }
+)
 
 from pm_bot.server.app import ASGIServer, ServerApp
 from pm_bot.server.github_auth import (
@@ -10,34 +20,6 @@ from pm_bot.server.github_auth import (
 )
 
 
-def _asgi_request(app: ASGIServer, method: str, path: str, body: bytes = b"") -> tuple[int, dict]:
-    scope = {
-        "type": "http",
-        "method": method,
-        "path": path,
-        "query_string": b"",
-    }
-    sent: list[dict] = []
-    received = False
-
-    async def receive() -> dict:
-        nonlocal received
-        if received:
-            return {"type": "http.request", "body": b"", "more_body": False}
-        received = True
-        return {"type": "http.request", "body": body, "more_body": False}
-
-    async def send(message: dict) -> None:
-        sent.append(message)
-
-    import asyncio
-
-    asyncio.run(app(scope, receive, send))
-    status = next(msg["status"] for msg in sent if msg["type"] == "http.response.start")
-    payload = b"".join(msg.get("body", b"") for msg in sent if msg["type"] == "http.response.body")
-    return status, json.loads(payload.decode("utf-8"))
-
-
 def test_validate_org_and_installation_context_reason_codes() -> None:
     tenant = GitHubTenantContext(
         tenant_mode="single_tenant", org="phys-sims", installation_id="1234"
@@ -66,21 +48,20 @@ def test_validate_org_and_installation_context_reason_codes() -> None:
     assert reason == REASON_INSTALLATION_MISMATCH
 
 
-def test_onboarding_state_machine_and_dry_run(monkeypatch) -> None:
-    monkeypatch.setenv("PM_BOT_ORG", "")
-    monkeypatch.setenv("PM_BOT_GITHUB_APP_INSTALLATION_ID", "")
-    pending = ServerApp()
-    assert pending.onboarding_dry_run()["readiness_state"] == "pending_context"
-
-    monkeypatch.setenv("PM_BOT_ORG", "phys-sims")
-    monkeypatch.setenv("PM_BOT_GITHUB_APP_INSTALLATION_ID", "")
-    single = ServerApp()
-    assert single.onboarding_dry_run()["readiness_state"] == "single_tenant_ready"
-
-    monkeypatch.setenv("PM_BOT_ORG", "phys-sims")
-    monkeypatch.setenv("PM_BOT_GITHUB_APP_INSTALLATION_ID", "42")
-    org_ready = ServerApp()
-    assert org_ready.onboarding_dry_run()["readiness_state"] == "org_ready"
+@pytest.mark.parametrize(
+    ("org", "installation_id", "expected_state"),
+    [
+        ("", "", "pending_context"),
+        ("phys-sims", "", "single_tenant_ready"),
+        ("phys-sims", "42", "org_ready"),
+    ],
+)
+def test_onboarding_state_machine_and_dry_run(
+    monkeypatch, org: str, installation_id: str, expected_state: str
+) -> None:
+    monkeypatch.setenv("PM_BOT_ORG", org)
+    monkeypatch.setenv("PM_BOT_GITHUB_APP_INSTALLATION_ID", installation_id)
+    assert ServerApp().onboarding_dry_run()["readiness_state"] == expected_state
 
 
 def test_http_request_context_denial_is_reason_coded(monkeypatch) -> None:
@@ -88,18 +69,11 @@ def test_http_request_context_denial_is_reason_coded(monkeypatch) -> None:
     service = ServerApp()
     app = ASGIServer(service=service)
 
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         app,
         "POST",
         "/changesets/propose",
-        body=json.dumps(
-            {
-                "operation": "create_issue",
-                "repo": "phys-sims/phys-pipeline",
-                "payload": {"title": "Denied context"},
-                "org": "other-org",
-            }
-        ).encode("utf-8"),
+        body=_DENIED_CONTEXT_PROPOSE_BODY,
     )
     assert status == 403
     assert payload["reason_code"] == "org_mismatch"
@@ -1,38 +1,30 @@
-import asyncio
 import json
 from pathlib import Path
 
-from pm_bot.shared.settings import get_storage_settings
+import pytest
+from _asgi_client import asgi_request, json_body
 
-from pm_bot.server.app import ASGIServer, ServerApp
+from pm_bot.control_plane.artifacts.store import FilesystemBlobStore, InMemoryBlobStore
+from pm_bot.server.app import ASGIServer, ServerApp, create_app
+from pm_bot.server.db import OrchestratorDB
 
-
-def _asgi_request(app: ASGIServer, method: str, path: str, body: dict | None = None):
-    scope = {"type": "http", "method": method, "path": path, "query_string": b""}
-    sent: list[dict] = []
-    payload = json.dumps(body).encode("utf-8") if body is not None else b""
-    delivered = False
-
-    async def receive() -> dict:
-        nonlocal delivered
-        if delivered:
-            return {"type": "http.request", "body": b"", "more_body": False}
-        delivered = True
-        return {"type": "http.request", "body": payload, "more_body": False}
-
-    async def send(message: dict) -> None:
-        sent.append(message)
-
-    asyncio.run(app(scope, receive, send))
-    status = next(msg["status"] for msg in sent if msg["type"] == "http.response.start")
-    body_bytes = b"".join(
-        msg.get("body", b"") for msg in sent if msg["type"] == "http.response.body"
-    )
-    return status, json.loads(body_bytes.decode("utf-8"))
+_HTTP_PLAN_EXPAND_BODY = json_body(
+    {
+        "repo_id": 1,
+        "source": "http",
+        "plan": {
+            "tasks": [
+                {"id": "a", "title": "A"},
+                {"id": "b", "title": "B", "deps": ["a"]},
+            ]
+        },
+    }
+)
+_AGGREGATE_BODY = json_body({"requested_by": "reviewer"})
 
 
-def test_plan_expansion_is_deterministic_snapshot() -> None:
-    service = ServerApp()
+def test_plan_expansion_is_deterministic_snapshot(server_app: ServerApp) -> None:
+    service = server_app
     plan = {
         "tasks": [
             {"id": "build", "title": "Build", "inputs": {"cmd": "make build"}},
@@ -87,57 +79,67 @@ def test_plan_expansion_is_deterministic_snapshot() -> None:
     assert stored_task_runs[1]["deps"] == ["task_3a966aca22c65250"]
 
 
-def test_plan_expand_and_dag_http_routes() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_plan_expand_and_dag_http_routes(asgi_app: ASGIServer) -> None:
+    app = asgi_app
 
-    expand_status, expand_payload = _asgi_request(
+    expand_status, expand_payload = asgi_request(
         app,
         "POST",
         "/plans/http-plan/expand",
-        body={
-            "repo_id": 1,
-            "source": "http",
-            "plan": {
-                "tasks": [
-                    {"id": "a", "title": "A"},
-                    {"id": "b", "title": "B", "deps": ["a"]},
-                ]
-            },
-        },
+        body=_HTTP_PLAN_EXPAND_BODY,
     )
     assert expand_status == 200
     assert expand_payload["plan_id"] == "http-plan"
 
-    dag_status, dag_payload = _asgi_request(app, "GET", "/plans/http-plan/dag")
+    dag_status, dag_payload = asgi_request(app, "GET", "/plans/http-plan/dag")
     assert dag_status == 200
     assert dag_payload["schema_version"] == "orchestration_dag/v1"
     assert len(dag_payload["tasks"]) == 2
     assert dag_payload["edges"]
 
 
-def _write_changeset_artifact(run_id: str, bundle_payload: dict) -> str:
-    settings = get_storage_settings()
-    artifact_path = Path(settings.artifact_dir) / f"{run_id}.changeset_bundle.json"
-    artifact_path.write_text(
-        json.dumps(
-            {
-                "run_id": run_id,
-                "thread_id": f"thread-{run_id}",
-                "graph_id": "repo_change_proposer/v1",
-                "context_pack": {"schema_version": "context_pack/v2"},
-                "changeset_bundle": bundle_payload,
-            },
-            sort_keys=True,
-            indent=2,
-        ),
-        encoding="utf-8",
+@pytest.fixture(params=["memory", "filesystem"])
+def aggregation_app(
+    request: pytest.FixtureRequest,
+    server_app: ServerApp,
+    _template_db: OrchestratorDB,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> ServerApp:
+    """App whose aggregation artifacts live in memory, or as ``file://`` URIs like runner output."""
+    if request.param == "memory":
+        monkeypatch.setattr(server_app, "blob_store", InMemoryBlobStore())
+        return server_app
+    return create_app(
+        db=_template_db.clone_in_memory(),
+        blob_store=FilesystemBlobStore(tmp_path / "artifacts"),
     )
-    return artifact_path.resolve().as_uri()
 
 
-def test_plan_aggregate_task_artifacts_merges_and_links_to_dag() -> None:
-    service = ServerApp()
+def _put_changeset_artifacts(service: ServerApp, artifacts: list[tuple[str, dict]]) -> list[str]:
+    """Store one changeset-bundle artifact per ``(run_id, bundle_payload)``; return their URIs."""
+    return [
+        service.blob_store.put(
+            f"{run_id}.changeset_bundle.json",
+            # Same sorted, indented layout the LangGraph adapter writes.
+            json.dumps(
+                {
+                    "run_id": run_id,
+                    "thread_id": f"thread-{run_id}",
+                    "graph_id": "repo_change_proposer/v1",
+                    "context_pack": {"schema_version": "context_pack/v2"},
+                    "changeset_bundle": bundle_payload,
+                },
+                sort_keys=True,
+                indent=2,
+            ).encode("ascii"),
+        )
+        for run_id, bundle_payload in artifacts
+    ]
+
+
+def test_plan_aggregate_task_artifacts_merges_and_links_to_dag(aggregation_app: ServerApp) -> None:
+    service = aggregation_app
     plan = {
         "tasks": [
             {"id": "a", "title": "A"},
@@ -181,35 +183,44 @@ def test_plan_aggregate_task_artifacts_merges_and_links_to_dag() -> None:
             },
         },
     ]
-    for idx, task_run in enumerate(task_runs):
-        service.db.update_task_run_result(
-            task_run["task_run_id"],
-            status="succeeded",
-            run_id=run_ids[idx],
-            thread_id=f"thread-{idx}",
-            clear_claim=True,
-        )
-        artifact_uri = _write_changeset_artifact(run_ids[idx], payloads[idx])
-        service.db.set_agent_run_artifacts(run_ids[idx], [artifact_uri])
+    artifact_uris = _put_changeset_artifacts(service, list(zip(run_ids, payloads)))
+    service.db.bulk_update_task_run_results(
+        [
+            {
+                "task_run_id": task_run["task_run_id"],
+                "status": "succeeded",
+                "run_id": run_ids[idx],
+                "thread_id": f"thread-{idx}",
+            }
+            for idx, task_run in enumerate(task_runs)
+        ],
+        clear_claim=True,
+    )
+    service.db.bulk_set_agent_run_artifacts(
+        {run_id: [uri] for run_id, uri in zip(run_ids, artifact_uris)}
+    )
 
     app = ASGIServer(service=service)
-    aggregate_status, aggregate_payload = _asgi_request(
+    aggregate_status, aggregate_payload = asgi_request(
         app,
         "POST",
         "/plans/agg-plan/aggregate",
-        body={"requested_by": "reviewer"},
+        body=_AGGREGATE_BODY,
     )
     assert aggregate_status == 200
     assert aggregate_payload["status"] == "ready_for_review"
     assert aggregate_payload["candidate_count"] == 2
 
-    dag_status, dag_payload = _asgi_request(app, "GET", "/plans/agg-plan/dag")
+    dag_status, dag_payload = asgi_request(app, "GET", "/plans/agg-plan/dag")
     assert dag_status == 200
-    assert dag_payload["aggregation"]["artifact_uri"].endswith(".aggregated_changeset_bundle.json")
+    aggregated_uri = dag_payload["aggregation"]["artifact_uri"]
+    assert aggregated_uri.endswith("agg-plan.aggregated_changeset_bundle.json")
+    aggregated = json.loads(service.blob_store.get(aggregated_uri))
+    assert [change["target_ref"] for change in aggregated["bundle"]["changesets"]] == ["#1", "#2"]
 
 
-def test_plan_aggregate_conflicts_surface_as_interrupts() -> None:
-    service = ServerApp()
+def test_plan_aggregate_conflicts_surface_as_interrupts(aggregation_app: ServerApp) -> None:
+    service = aggregation_app
     service.expand_plan(
         plan_id="conflict-plan",
         payload={"tasks": [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]},
@@ -217,42 +228,54 @@ def test_plan_aggregate_conflicts_surface_as_interrupts() -> None:
         source="test",
     )
     task_runs = service.db.list_task_runs("conflict-plan")
-    for idx, task_run in enumerate(task_runs, start=1):
-        run_id = f"run-conflict-{idx}"
-        service.db.update_task_run_result(
-            task_run["task_run_id"],
-            status="succeeded",
-            run_id=run_id,
-            thread_id=f"thread-conflict-{idx}",
-            clear_claim=True,
-        )
-        artifact_uri = _write_changeset_artifact(
-            run_id,
-            {
-                "schema_version": "changeset_bundle_proposal/v1",
-                "bundle": {
-                    "bundle_id": f"bundle-conflict-{idx}",
-                    "requires_human_approval": True,
-                    "changesets": [
-                        {
-                            "operation": "update_issue",
-                            "repo": "acme/repo",
-                            "target_ref": "#9",
-                            "idempotency_key": f"k-conflict-{idx}",
-                            "payload": {"body": f"conflict-{idx}"},
-                        }
-                    ],
+    run_ids = [f"run-conflict-{idx}" for idx in range(1, len(task_runs) + 1)]
+    artifact_uris = _put_changeset_artifacts(
+        service,
+        [
+            (
+                run_id,
+                {
+                    "schema_version": "changeset_bundle_proposal/v1",
+                    "bundle": {
+                        "bundle_id": f"bundle-conflict-{idx}",
+                        "requires_human_approval": True,
+                        "changesets": [
+                            {
+                                "operation": "update_issue",
+                                "repo": "acme/repo",
+                                "target_ref": "#9",
+                                "idempotency_key": f"k-conflict-{idx}",
+                                "payload": {"body": f"conflict-{idx}"},
+                            }
+                        ],
+                    },
                 },
-            },
-        )
-        service.db.set_agent_run_artifacts(run_id, [artifact_uri])
+            )
+            for idx, run_id in enumerate(run_ids, start=1)
+        ],
+    )
+    service.db.bulk_update_task_run_results(
+        [
+            {
+                "task_run_id": task_run["task_run_id"],
+                "status": "succeeded",
+                "run_id": run_id,
+                "thread_id": f"thread-conflict-{idx}",
+            }
+            for idx, (task_run, run_id) in enumerate(zip(task_runs, run_ids), start=1)
+        ],
+        clear_claim=True,
+    )
+    service.db.bulk_set_agent_run_artifacts(
+        {run_id: [uri] for run_id, uri in zip(run_ids, artifact_uris)}
+    )
 
     app = ASGIServer(service=service)
-    aggregate_status, aggregate_payload = _asgi_request(
+    aggregate_status, aggregate_payload = asgi_request(
         app,
         "POST",
         "/plans/conflict-plan/aggregate",
-        body={"requested_by": "reviewer"},
+        body=_AGGREGATE_BODY,
     )
     assert aggregate_status == 409
     assert aggregate_payload["error"] == "changeset_bundle_conflict_detected"
@@ -261,3 +284,33 @@ def test_plan_aggregate_conflicts_surface_as_interrupts() -> None:
     assert len(interrupts) == 1
     assert interrupts[0]["kind"] == "changeset_conflict"
     assert interrupts[0]["payload"]["reason_code"] == "changeset_bundle_conflict_detected"
+
+
+def test_bulk_task_run_updates_match_single_row_updates(server_app: ServerApp) -> None:
+    service = server_app
+    service.expand_plan(
+        plan_id="bulk-plan",
+        payload={"tasks": [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]},
+        repo_id=1,
+        source="test",
+    )
+    first, second = service.db.list_task_runs("bulk-plan")
+
+    service.db.bulk_update_task_run_results(
+        [
+            {"task_run_id": first["task_run_id"], "status": "succeeded", "run_id": "run-a"},
+            {"task_run_id": second["task_run_id"], "status": "failed", "reason_code": "boom"},
+        ]
+    )
+    service.db.bulk_set_agent_run_artifacts({"run-a": ["mem://a.log", "mem://a.json"]})
+
+    updated = {row["task_run_id"]: row for row in service.db.list_task_runs("bulk-plan")}
+    assert updated[first["task_run_id"]]["status"] == "succeeded"
+    assert updated[first["task_run_id"]]["run_id"] == "run-a"
+    assert updated[second["task_run_id"]]["status"] == "failed"
+    assert updated[second["task_run_id"]]["run_id"] == second["run_id"]
+    assert updated[second["task_run_id"]]["last_error_code"] == "boom"
+    assert [row["uri"] for row in service.db.list_run_artifacts("run-a")] == [
+        "mem://a.log",
+        "mem://a.json",
+    ]
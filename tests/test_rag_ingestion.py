@@ -1,41 +1,22 @@
-import asyncio
-import json
+from collections.abc import Iterator
+
+import pytest
+from _asgi_client import asgi_request
 
 from pm_bot.control_plane.api.app import ASGIServer, ServerApp
 from pm_bot.control_plane.rag.ingestion import DocsIngestionService
 
 
-def _asgi_request(
-    app: ASGIServer,
-    method: str,
-    path: str,
-    body: bytes = b"",
-    query_string: bytes = b"",
-) -> tuple[int, dict]:
-    scope = {
-        "type": "http",
-        "method": method,
-        "path": path,
-        "query_string": query_string,
-    }
-    sent: list[dict] = []
-    received = False
-
-    async def receive() -> dict:
-        nonlocal received
-        if received:
-            return {"type": "http.request", "body": b"", "more_body": False}
-        received = True
-        return {"type": "http.request", "body": body, "more_body": False}
-
-    async def send(message: dict) -> None:
-        sent.append(message)
-
-    asyncio.run(app(scope, receive, send))
-
-    status = next(msg["status"] for msg in sent if msg["type"] == "http.response.start")
-    payload = b"".join(msg.get("body", b"") for msg in sent if msg["type"] == "http.response.body")
-    return status, json.loads(payload.decode("utf-8"))
+@pytest.fixture(scope="module")
+def indexed_rag_app() -> Iterator[ASGIServer]:
+    """ASGI app whose docs index is built once and shared by query-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PMBOT_RAG_VECTOR_BACKEND", "memory")
+        mp.setenv("PMBOT_RAG_EMBEDDING_PROVIDER", "local")
+        app = ASGIServer(service=ServerApp())
+        status, _payload = asgi_request(app, "POST", "/rag/index", body=b"{}")
+        assert status == 200
+        yield app
 
 
 def test_chunk_ids_are_stable_and_provenance_is_preserved(monkeypatch):
@@ -65,16 +46,16 @@ def test_rag_http_routes_index_status_and_query(monkeypatch):
 
     app = ASGIServer(service=ServerApp())
 
-    index_status, index_payload = _asgi_request(app, "POST", "/rag/index", body=b"{}")
+    index_status, index_payload = asgi_request(app, "POST", "/rag/index", body=b"{}")
     assert index_status == 200
     assert index_payload["status"] == "completed"
     assert index_payload["chunks_upserted"] > 0
 
-    status_status, status_payload = _asgi_request(app, "GET", "/rag/status")
+    status_status, status_payload = asgi_request(app, "GET", "/rag/status")
     assert status_status == 200
     assert status_payload["status"] == "completed"
 
-    query_status, query_payload = _asgi_request(
+    query_status, query_payload = asgi_request(
         app,
         "GET",
         "/rag/query",
@@ -88,15 +69,9 @@ def test_rag_http_routes_index_status_and_query(monkeypatch):
     assert row["metadata"]["source_path"].startswith("docs/")
 
 
-def test_rag_query_post_route_supports_filters(monkeypatch):
-    monkeypatch.setenv("PMBOT_RAG_VECTOR_BACKEND", "memory")
-    monkeypatch.setenv("PMBOT_RAG_EMBEDDING_PROVIDER", "local")
-
-    app = ASGIServer(service=ServerApp())
-    _asgi_request(app, "POST", "/rag/index", body=b"{}")
-
-    status, payload = _asgi_request(
-        app,
+def test_rag_query_post_route_supports_filters(indexed_rag_app: ASGIServer):
+    status, payload = asgi_request(
+        indexed_rag_app,
         "POST",
         "/rag/query",
         body=(
@@ -113,6 +88,6 @@ def test_rag_query_requires_query_param(monkeypatch):
     monkeypatch.setenv("PMBOT_RAG_VECTOR_BACKEND", "memory")
     app = ASGIServer(service=ServerApp())
 
-    status, payload = _asgi_request(app, "GET", "/rag/query")
+    status, payload = asgi_request(app, "GET", "/rag/query")
     assert status == 400
     assert payload["error"] == "missing_q"
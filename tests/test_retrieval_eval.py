@@ -1,32 +1,48 @@
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from pm_bot.control_plane.rag.ingestion import DocsIngestionService, QueryFilters
 from pm_bot.server.app import ServerApp
 
+_GOLDEN = json.loads(Path("tests/fixtures/rag_golden_queries.json").read_text(encoding="utf-8"))
 
-def test_retrieval_golden_snapshot_regression(tmp_path, monkeypatch):
-    monkeypatch.setenv("PMBOT_RAG_VECTOR_BACKEND", "memory")
-    monkeypatch.setenv("PMBOT_RAG_EMBEDDING_PROVIDER", "local")
 
-    fixture = json.loads(Path("tests/fixtures/rag_golden_queries.json").read_text(encoding="utf-8"))
-    for doc in fixture["corpus"]:
-        file_path = tmp_path / doc["path"]
+@pytest.fixture(scope="module")
+def golden_rag_service(tmp_path_factory: pytest.TempPathFactory) -> Iterator[DocsIngestionService]:
+    """Golden corpus written and indexed once; query cases only run retrieval against it."""
+    repo_root = tmp_path_factory.mktemp("rag-golden")
+    for doc in _GOLDEN["corpus"]:
+        file_path = repo_root / doc["path"]
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(doc["content"], encoding="utf-8")
 
-    app = ServerApp()
-    service = DocsIngestionService(db=app.db, repo_root=tmp_path)
-    indexed = service.index_docs(repo_id=int(fixture["repo_id"]), chunk_lines=100)
-    assert indexed["status"] == "completed"
-
-    for query_case in fixture["queries"]:
-        hits = service.query(
-            query_text=query_case["query"],
-            limit=int(query_case["top_k"]),
-            filters=QueryFilters(
-                repo_id=int(fixture["repo_id"]),
-                doc_types=tuple(sorted(query_case.get("filters", {}).get("doc_types", []))),
-            ),
-        )
-        assert [hit.chunk_id for hit in hits] == query_case["expected_chunk_ids"]
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PMBOT_RAG_VECTOR_BACKEND", "memory")
+        mp.setenv("PMBOT_RAG_EMBEDDING_PROVIDER", "local")
+        service = DocsIngestionService(db=ServerApp().db, repo_root=repo_root)
+        indexed = service.index_docs(repo_id=int(_GOLDEN["repo_id"]), chunk_lines=100)
+        assert indexed["status"] == "completed"
+        yield service
+
+
+@pytest.mark.parametrize(
+    "query_case",
+    _GOLDEN["queries"],
+    ids=[str(case.get("id", case["query"])) for case in _GOLDEN["queries"]],
+)
+def test_retrieval_golden_snapshot_regression(
+    golden_rag_service: DocsIngestionService, query_case: dict[str, Any]
+) -> None:
+    hits = golden_rag_service.query(
+        query_text=query_case["query"],
+        limit=int(query_case["top_k"]),
+        filters=QueryFilters(
+            repo_id=int(_GOLDEN["repo_id"]),
+            doc_types=tuple(sorted(query_case.get("filters", {}).get("doc_types", []))),
+        ),
+    )
+    assert [hit.chunk_id for hit in hits] == query_case["expected_chunk_ids"]
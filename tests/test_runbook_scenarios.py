@@ -1,15 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 import pytest
 
 from pm_bot.github.parse_issue_body import parse_issue_body
 from pm_bot.github.render_issue_body import render_issue_body
-from pm_bot.server.app import create_app
-from pm_bot.server.github_connector import RetryableGitHubError
+from pm_bot.server.app import ServerApp, create_app
+from pm_bot.server.github_connector import (
+    DEFAULT_ALLOWED_REPOS,
+    GitHubConnector,
+    RetryableGitHubError,
+    WriteRequest,
+)
+from pm_bot.server.github_connector_inmemory import InMemoryGitHubConnector
+
+
+class _FlakyConnector(InMemoryGitHubConnector):
+    """Fails with a retryable error until ``succeed_on_attempt`` is reached."""
+
+    def __init__(self, succeed_on_attempt: int) -> None:
+        super().__init__(allowed_repos=set(DEFAULT_ALLOWED_REPOS))
+        self.succeed_on_attempt = succeed_on_attempt
+        self.attempts = 0
+
+    def execute_write(self, request: WriteRequest) -> dict[str, Any]:
+        self.attempts += 1
+        if self.attempts < self.succeed_on_attempt:
+            raise RetryableGitHubError(
+                "rate limited", reason_code="github_rate_limited", retry_after_s=0
+            )
+        return {"status": "applied", "issue": {"number": 503}}
+
 
+class _AlwaysRetryConnector(InMemoryGitHubConnector):
+    def __init__(self) -> None:
+        super().__init__(allowed_repos=set(DEFAULT_ALLOWED_REPOS))
+        self.attempts = 0
 
-def test_runbook_flow_draft_parse_render_roundtrip() -> None:
-    app = create_app()
+    def execute_write(self, request: WriteRequest) -> dict[str, Any]:
+        self.attempts += 1
+        raise RetryableGitHubError("flaky", reason_code="github_503", retry_after_s=0)
+
+
+def test_runbook_flow_draft_parse_render_roundtrip(server_app: ServerApp) -> None:
+    app = server_app
     draft = app.draft(
         item_type="feature",
         title="Runbook flow",
@@ -28,8 +64,18 @@ def test_runbook_flow_draft_parse_render_roundtrip() -> None:
     assert parsed["priority"] == "P1"
 
 
-def test_runbook_flow_approve_changeset() -> None:
-    app = create_app()
+@pytest.fixture
+def drill_app(request: pytest.FixtureRequest, server_app: ServerApp) -> ServerApp:
+    """Module-shared app for default-connector drills; a fresh app around any injected double."""
+    connector_factory: Callable[[], GitHubConnector] | None = request.param
+    if connector_factory is None:
+        return server_app
+    app = create_app(connector=connector_factory())
+    app.changesets.sleep = lambda _seconds: None
+    return app
+
+
+def _drill_approve(app: ServerApp) -> None:
     proposed = app.propose_changeset(
         operation="create_issue",
         repo="phys-sims/phys-pipeline",
@@ -41,8 +87,7 @@ def test_runbook_flow_approve_changeset() -> None:
     assert result["status"] == "applied"
 
 
-def test_runbook_flow_idempotency_reuses_existing_changeset() -> None:
-    app = create_app()
+def _drill_idempotency(app: ServerApp) -> None:
     payload = {"issue_ref": "#502", "title": "Idempotency drill"}
     first = app.propose_changeset(
         operation="create_issue",
@@ -60,52 +105,62 @@ def test_runbook_flow_idempotency_reuses_existing_changeset() -> None:
     assert reuse_events
 
 
-def test_reliability_drill_retries_then_succeeds() -> None:
-    app = create_app()
+def _drill_retry_success(app: ServerApp) -> None:
     proposed = app.propose_changeset(
         operation="create_issue",
         repo="phys-sims/phys-pipeline",
         payload={"issue_ref": "#503", "title": "Retry drill"},
     )
 
-    attempts = {"count": 0}
-
-    def _flaky(_request: object) -> dict[str, object]:
-        attempts["count"] += 1
-        if attempts["count"] < 3:
-            raise RetryableGitHubError(
-                "rate limited", reason_code="github_rate_limited", retry_after_s=0
-            )
-        return {"status": "applied", "issue": {"number": 503}}
-
-    app.connector.execute_write = _flaky  # type: ignore[method-assign]
+    backoffs: list[float] = []
+    app.changesets.sleep = backoffs.append
 
     result = app.approve_changeset(proposed["id"], approved_by="qa-reviewer", run_id="run-retry")
 
     assert result["status"] == "applied"
-    audit_attempts = app.db.list_audit_events("changeset_attempt")
-    assert [entry["payload"]["result"] for entry in audit_attempts[-3:]] == [
+    audit_attempts = app.db.list_audit_events("changeset_attempt", limit=3)
+    assert [entry["payload"]["result"] for entry in audit_attempts] == [
         "retryable_failure",
         "retryable_failure",
         "success",
     ]
+    assert backoffs == [0.1, 0.2]
+    assert isinstance(app.connector, _FlakyConnector)
+    assert app.connector.attempts == 3
 
 
-def test_reliability_drill_retry_budget_exhaustion_dead_letters() -> None:
-    app = create_app()
+def _drill_retry_dead_letter(app: ServerApp) -> None:
     proposed = app.propose_changeset(
         operation="create_issue",
         repo="phys-sims/phys-pipeline",
         payload={"issue_ref": "#504", "title": "Dead-letter drill"},
     )
 
-    def _always_retry(_request: object) -> dict[str, object]:
-        raise RetryableGitHubError("flaky", reason_code="github_503", retry_after_s=0)
-
-    app.connector.execute_write = _always_retry  # type: ignore[method-assign]
-
     with pytest.raises(RuntimeError, match="retry_budget_exhausted"):
         app.approve_changeset(proposed["id"], approved_by="qa-reviewer", run_id="run-dead-letter")
 
     dead_letters = app.db.list_audit_events("changeset_dead_lettered")
     assert dead_letters[-1]["payload"]["reason_code"] == "retry_budget_exhausted"
+
+
+_CHANGESET_DRILLS: dict[str, Callable[[ServerApp], None]] = {
+    "approve": _drill_approve,
+    "idempotency": _drill_idempotency,
+    "retry_success": _drill_retry_success,
+    "retry_dead_letter": _drill_retry_dead_letter,
+}
+
+
+@pytest.mark.parametrize(
+    ("scenario", "drill_app"),
+    [
+        ("approve", None),
+        ("idempotency", None),
+        ("retry_success", lambda: _FlakyConnector(succeed_on_attempt=3)),
+        ("retry_dead_letter", _AlwaysRetryConnector),
+    ],
+    ids=["approve", "idempotency", "retry_success", "retry_dead_letter"],
+    indirect=["drill_app"],
+)
+def test_runbook_changeset_drills(scenario: str, drill_app: ServerApp) -> None:
+    _CHANGESET_DRILLS[scenario](drill_app)
@@ -1,11 +1,16 @@
 import json
+import re
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
-from pm_bot.server.app import create_app
+from pm_bot.server.app import ServerApp, create_app
 from pm_bot.server.runner import RunnerAdapter, RunnerPollResult, RunnerSubmitResult
 from pm_bot.server.runner_adapters import (
+    default_runner_adapter_name,
     registered_runner_adapters,
 )
 from pm_bot.server.runner_adapters.provider_stub import (
@@ -13,37 +18,47 @@ from pm_bot.server.runner_adapters.provider_stub import (
     normalize_provider_failure,
 )
 
+_INVALID_TRANSITION_RE = re.compile("invalid_transition:not_allowed")
+_WRITE_CREDENTIALS_RE = re.compile("runner_context_includes_write_credentials")
+_UNKNOWN_ADAPTER_RE = re.compile("unknown_adapter")
 
-def _minimal_spec(run_id: str, **extra: object) -> dict[str, object]:
-    spec: dict[str, object] = {
-        "run_id": run_id,
+_MINIMAL_SPEC_BASE: Mapping[str, object] = MappingProxyType(
+    {
         "model": "gpt-5",
         "intent": "test",
         "requires_approval": True,
         "adapter": "manual",
     }
-    spec.update(extra)
-    return spec
+)
 
 
-def _langgraph_spec(run_id: str, **extra: object) -> dict[str, object]:
-    spec: dict[str, object] = {
+def _minimal_spec(run_id: str, **extra: object) -> dict[str, object]:
+    return {"run_id": run_id, **_MINIMAL_SPEC_BASE, **extra}
+
+
+# v2 specs are re-validated into fresh dicts by the runner, so the nested objects below are
+# shared across calls instead of being rebuilt for every spec. Treat them as read-only.
+_LANGGRAPH_BUDGET: dict[str, object] = {
+    "max_total_tokens": 2000,
+    "max_tool_calls": 10,
+    "max_wall_seconds": 300,
+}
+
+_LANGGRAPH_EXECUTION: dict[str, object] = {
+    "engine": "langgraph",
+    "graph_id": "repo_change_proposer/v1",
+    "thread_id": None,
+    "budget": _LANGGRAPH_BUDGET,
+    "tools_allowed": ["github_read", "pytest"],
+    "scopes": {"repo": "phys-sims/pm-bot"},
+}
+
+_LANGGRAPH_SPEC_BASE: Mapping[str, object] = MappingProxyType(
+    {
         "schema_version": "agent_run_spec/v2",
-        "run_id": run_id,
         "goal": "Test langgraph execution",
         "inputs": {"context_pack_id": "ctx-1"},
-        "execution": {
-            "engine": "langgraph",
-            "graph_id": "repo_change_proposer/v1",
-            "thread_id": None,
-            "budget": {
-                "max_total_tokens": 2000,
-                "max_tool_calls": 10,
-                "max_wall_seconds": 300,
-            },
-            "tools_allowed": ["github_read", "pytest"],
-            "scopes": {"repo": "phys-sims/pm-bot"},
-        },
+        "execution": _LANGGRAPH_EXECUTION,
         "model": "gpt-5",
         "intent": "langgraph test",
         "requires_approval": True,
@@ -53,14 +68,11 @@ def _langgraph_spec(run_id: str, **extra: object) -> dict[str, object]:
             {"type": "tool_call", "tool": "github_read", "node_id": "read_repo"},
         ],
     }
-    spec.update(extra)
-    return spec
-
+)
 
-def _repo_change_proposer_spec(run_id: str, **extra: object) -> dict[str, object]:
-    spec: dict[str, object] = {
+_REPO_CHANGE_PROPOSER_SPEC_BASE: Mapping[str, object] = MappingProxyType(
+    {
         "schema_version": "agent_run_spec/v2",
-        "run_id": run_id,
         "goal": "Propose repository changes as a changeset bundle",
         "inputs": {
             "context_pack_id": "ctx-repo-change-1",
@@ -80,46 +92,49 @@ def _repo_change_proposer_spec(run_id: str, **extra: object) -> dict[str, object
                 "blocker_changes": [],
             },
         },
-        "execution": {
-            "engine": "langgraph",
-            "graph_id": "repo_change_proposer/v1",
-            "thread_id": None,
-            "budget": {
-                "max_total_tokens": 2000,
-                "max_tool_calls": 10,
-                "max_wall_seconds": 300,
-            },
-            "tools_allowed": ["github_read"],
-            "scopes": {"repo": "phys-sims/pm-bot"},
-        },
+        "execution": {**_LANGGRAPH_EXECUTION, "tools_allowed": ["github_read"]},
         "model": "gpt-5",
         "intent": "repo_change_proposal",
         "requires_approval": True,
         "adapter": "langgraph",
     }
-    spec.update(extra)
-    return spec
+)
 
 
-@pytest.mark.parametrize(
-    ("provider_reason", "expected"),
-    [
+def _langgraph_spec(run_id: str, **extra: object) -> dict[str, object]:
+    return {"run_id": run_id, **_LANGGRAPH_SPEC_BASE, **extra}
+
+
+def _repo_change_proposer_spec(run_id: str, **extra: object) -> dict[str, object]:
+    return {"run_id": run_id, **_REPO_CHANGE_PROPOSER_SPEC_BASE, **extra}
+
+
+def test_provider_failure_reason_normalization() -> None:
+    for provider_reason, expected in (
         ("timeout", "provider_timeout"),
         ("rate_limit", "provider_rate_limited"),
         ("auth", "provider_auth_denied"),
         ("validation", "provider_invalid_request"),
         ("internal", "provider_unavailable"),
         ("unexpected", "provider_failed"),
-    ],
+    ):
+        assert normalize_provider_failure(provider_reason) == expected, provider_reason
+
+
+# Without a db only the manual and provider-stub adapters are built; both hold no state, so one
+# read-only registry serves every contract test.
+_STATELESS_ADAPTERS: Mapping[str, RunnerAdapter] = MappingProxyType(
+    registered_runner_adapters(enable_provider_stub=True)
 )
-def test_provider_failure_reason_normalization(provider_reason: str, expected: str) -> None:
-    assert normalize_provider_failure(provider_reason) == expected
+
+
+def _with_spec_states(run: dict[str, Any], **states: str) -> dict[str, Any]:
+    return {**run, "spec": {**run["spec"], **states}}
 
 
 @pytest.mark.parametrize("adapter_name", ["manual", "provider_stub"])
 def test_runner_adapter_contract_parity(adapter_name: str) -> None:
-    adapters = registered_runner_adapters(enable_provider_stub=True)
-    adapter: RunnerAdapter = adapters[adapter_name]
+    adapter: RunnerAdapter = _STATELESS_ADAPTERS[adapter_name]
     run = {
         "run_id": f"run-{adapter_name}",
         "spec": {
@@ -133,21 +148,12 @@ def test_runner_adapter_contract_parity(adapter_name: str) -> None:
     assert submitted.job_id
 
     poll_running = adapter.poll(
-        {
-            **run,
-            "spec": {
-                **run["spec"],
-                "manual_poll_state": "running",
-                "provider_poll_state": "running",
-            },
-        }
+        _with_spec_states(run, manual_poll_state="running", provider_poll_state="running")
     )
     assert isinstance(poll_running, RunnerPollResult)
     assert poll_running.state == "running"
 
-    poll_completed = adapter.poll(run)
-    assert isinstance(poll_completed, RunnerPollResult)
-    assert poll_completed.state == "completed"
+    assert adapter.poll(run).state == "completed"
 
     artifacts = adapter.fetch_artifacts(run)
     assert isinstance(artifacts, list)
@@ -158,8 +164,8 @@ def test_runner_adapter_contract_parity(adapter_name: str) -> None:
     assert cancelled.state == "cancelled"
 
 
-def test_runner_transition_matrix_enforced() -> None:
-    app = create_app()
+def test_runner_transition_matrix_enforced(server_app: ServerApp) -> None:
+    app = server_app
     run = app.propose_agent_run(spec=_minimal_spec("run-1"), created_by="alice")
     assert run["status"] == "proposed"
 
@@ -171,7 +177,7 @@ def test_runner_transition_matrix_enforced() -> None:
     )
     assert approved["status"] == "approved"
 
-    with pytest.raises(ValueError, match="invalid_transition:not_allowed"):
+    with pytest.raises(ValueError, match=_INVALID_TRANSITION_RE):
         app.transition_agent_run(
             run_id="run-1",
             to_status="completed",
@@ -180,23 +186,23 @@ def test_runner_transition_matrix_enforced() -> None:
         )
 
 
-def test_runner_execute_manual_adapter_happy_path() -> None:
-    app = create_app()
-    app.propose_agent_run(spec=_minimal_spec("run-ok"), created_by="alice")
-    app.transition_agent_run("run-ok", to_status="approved", reason_code="human_approved")
-
-    claimed = app.claim_agent_runs(worker_id="w1", limit=2, lease_seconds=60)
-    assert [item["run_id"] for item in claimed] == ["run-ok"]
+def test_claim_agent_runs_claims_approved_runs_in_one_batch(server_app: ServerApp) -> None:
+    app = server_app
+    run_ids = ["run-batch-1", "run-batch-2", "run-batch-3"]
+    for run_id in run_ids:
+        app.propose_agent_run(spec=_minimal_spec(run_id), created_by="alice")
+        app.transition_agent_run(run_id, to_status="approved", reason_code="human_approved")
 
-    result = app.execute_claimed_agent_run(run_id="run-ok", worker_id="w1")
-    assert result["status"] == "completed"
+    claimed = app.claim_agent_runs(worker_id="w1", limit=len(run_ids), lease_seconds=60)
 
-    artifacts = app.db.list_audit_events("agent_run_artifacts")
-    assert artifacts[-1]["payload"]["run_id"] == "run-ok"
+    assert [run["run_id"] for run in claimed] == run_ids
+    assert {run["claimed_by"] for run in claimed} == {"w1"}
+    assert all(run["claim_expires_at"] for run in claimed)
+    assert app.claim_agent_runs(worker_id="w2", limit=len(run_ids)) == []
 
 
-def test_runner_retry_and_dead_letter() -> None:
-    app = create_app()
+def test_runner_retry_and_dead_letter(server_app: ServerApp) -> None:
+    app = server_app
     app.propose_agent_run(
         spec=_minimal_spec("run-fail", manual_poll_state="failed", max_retries=1),
         created_by="alice",
@@ -208,10 +214,7 @@ def test_runner_retry_and_dead_letter() -> None:
     first = app.execute_claimed_agent_run(run_id="run-fail", worker_id="w1")
     assert first["status"] == "approved"
 
-    app.db.conn.execute(
-        "UPDATE agent_runs SET next_attempt_at = CURRENT_TIMESTAMP WHERE run_id = ?", ("run-fail",)
-    )
-    app.db.conn.commit()
+    app.db.mark_agent_run_claimable("run-fail")
     claimed_again = app.claim_agent_runs(worker_id="w1", limit=1)
     assert claimed_again and claimed_again[0]["run_id"] == "run-fail"
     second = app.execute_claimed_agent_run(run_id="run-fail", worker_id="w1")
@@ -222,43 +225,84 @@ def test_runner_retry_and_dead_letter() -> None:
     assert dead[-1]["payload"]["run_id"] == "run-fail"
 
 
-def test_runner_execute_provider_adapter_reason_mapping() -> None:
-    app = create_app()
-    app.runner = app.runner.__class__(
-        db=app.db,
-        adapters=registered_runner_adapters(enable_provider_stub=True),
-        default_adapter_name="manual",
+def _budget_exceeded_langgraph_spec(run_id: str) -> dict[str, object]:
+    return _langgraph_spec(
+        run_id,
+        policy_violation_mode="fail",
+        execution={
+            **_LANGGRAPH_EXECUTION,
+            "budget": {**_LANGGRAPH_BUDGET, "max_total_tokens": 10},
+            "tools_allowed": ["github_read"],
+        },
+        simulated_steps=[{"type": "model_call", "tokens": 20, "node_id": "draft"}],
+        max_retries=0,
     )
-    app.propose_agent_run(
-        spec=_minimal_spec(
+
+
+@pytest.mark.parametrize(
+    ("run_id", "build_spec", "enable_provider_stub", "expected_status", "expected_last_error"),
+    [
+        pytest.param("run-ok", _minimal_spec, False, "completed", "", id="manual_ok"),
+        pytest.param(
             "run-provider-fail",
-            adapter="provider_stub",
-            provider_poll_state="failed",
-            provider_failure_reason="rate_limit",
-            max_retries=0,
+            lambda run_id: _minimal_spec(
+                run_id,
+                adapter="provider_stub",
+                provider_poll_state="failed",
+                provider_failure_reason="rate_limit",
+                max_retries=0,
+            ),
+            True,
+            "failed",
+            "provider_rate_limited",
+            id="provider_fail",
         ),
-        created_by="alice",
-    )
-    app.transition_agent_run(
-        "run-provider-fail",
-        to_status="approved",
-        reason_code="human_approved",
-    )
+        pytest.param(
+            "run-langgraph-budget",
+            _budget_exceeded_langgraph_spec,
+            False,
+            "failed",
+            "budget.total_tokens",
+            id="langgraph_budget_fail",
+        ),
+    ],
+)
+def test_runner_execute_scenarios(
+    server_app: ServerApp,
+    run_id: str,
+    build_spec: Callable[[str], dict[str, object]],
+    enable_provider_stub: bool,
+    expected_status: str,
+    expected_last_error: str,
+) -> None:
+    app = server_app
+    if enable_provider_stub:
+        app.runner = app.runner.__class__(
+            db=app.db,
+            adapters=registered_runner_adapters(enable_provider_stub=True, db=app.db),
+            default_adapter_name="manual",
+        )
+    app.propose_agent_run(spec=build_spec(run_id), created_by="alice")
+    app.transition_agent_run(run_id, to_status="approved", reason_code="human_approved")
 
-    claimed = app.claim_agent_runs(worker_id="w1", limit=1)
-    assert claimed and claimed[0]["run_id"] == "run-provider-fail"
-    result = app.execute_claimed_agent_run(run_id="run-provider-fail", worker_id="w1")
-    assert result["status"] == "failed"
+    claimed = app.claim_agent_runs(worker_id="w1", limit=2, lease_seconds=60)
+    assert [item["run_id"] for item in claimed] == [run_id]
 
-    persisted = app.db.get_agent_run("run-provider-fail")
+    result = app.execute_claimed_agent_run(run_id=run_id, worker_id="w1")
+    assert result["status"] == expected_status
+
+    persisted = app.db.get_agent_run(run_id)
     assert persisted is not None
-    assert persisted["last_error"] == "provider_rate_limited"
+    assert persisted["last_error"] == expected_last_error
+    if expected_status == "completed":
+        artifacts = app.db.list_audit_events("agent_run_artifacts")
+        assert artifacts[-1]["payload"]["run_id"] == run_id
 
 
-def test_runner_context_guardrail_blocks_write_credentials() -> None:
-    app = create_app()
+def test_runner_context_guardrail_blocks_write_credentials(server_app: ServerApp) -> None:
+    app = server_app
 
-    with pytest.raises(ValueError, match="runner_context_includes_write_credentials"):
+    with pytest.raises(ValueError, match=_WRITE_CREDENTIALS_RE):
         app.propose_agent_run(
             spec=_minimal_spec(
                 "run-cred-blocked",
@@ -268,11 +312,17 @@ def test_runner_context_guardrail_blocks_write_credentials() -> None:
         )
 
 
-def test_runner_unknown_configured_default_falls_back_to_manual(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    monkeypatch.setenv("PM_BOT_RUNNER_DEFAULT_ADAPTER", "does-not-exist")
-    app = create_app()
+def test_default_runner_adapter_name_prefers_explicit_setting_over_env() -> None:
+    env = {"PM_BOT_RUNNER_DEFAULT_ADAPTER": "provider_stub"}
+    adapters = dict(_STATELESS_ADAPTERS)
+
+    assert default_runner_adapter_name(env, adapters=adapters) == "provider_stub"
+    assert default_runner_adapter_name(env, adapters=adapters, configured="manual") == "manual"
+    assert default_runner_adapter_name(env, adapters=adapters, configured="missing") == "manual"
+
+
+def test_runner_unknown_configured_default_falls_back_to_manual() -> None:
+    app = create_app(runner_default_adapter="does-not-exist")
     run = app.propose_agent_run(
         spec={
             "run_id": "run-default-adapter",
@@ -285,26 +335,29 @@ def test_runner_unknown_configured_default_falls_back_to_manual(
     assert run["adapter_name"] == "manual"
 
 
-def test_runner_rejects_unknown_adapter() -> None:
-    app = create_app()
-    with pytest.raises(ValueError, match="unknown_adapter"):
-        app.propose_agent_run(
-            spec=_minimal_spec("run-unknown-adapter", adapter="unknown-provider"),
-            created_by="alice",
-        )
-
-
-def test_provider_adapter_not_enabled_by_default() -> None:
-    app = create_app()
-    with pytest.raises(ValueError, match="unknown_adapter"):
-        app.propose_agent_run(
-            spec=_minimal_spec("run-provider-disabled", adapter=ProviderStubRunnerAdapter.name),
+@pytest.mark.parametrize(
+    ("adapter", "run_id"),
+    [
+        pytest.param("unknown-provider", "run-unknown-adapter", id="unknown"),
+        pytest.param(
+            ProviderStubRunnerAdapter.name, "run-provider-disabled", id="provider_not_enabled"
+        ),
+    ],
+)
+def test_runner_rejects_unregistered_adapter(
+    server_app: ServerApp, adapter: str, run_id: str
+) -> None:
+    with pytest.raises(ValueError, match=_UNKNOWN_ADAPTER_RE):
+        server_app.propose_agent_run(
+            spec=_minimal_spec(run_id, adapter=adapter),
             created_by="alice",
         )
 
 
-def test_langgraph_adapter_submit_poll_complete_with_thread_and_checkpoint() -> None:
-    app = create_app()
+def test_langgraph_adapter_submit_poll_complete_with_thread_and_checkpoint(
+    server_app: ServerApp,
+) -> None:
+    app = server_app
     app.propose_agent_run(spec=_langgraph_spec("run-langgraph-ok"), created_by="alice")
     app.transition_agent_run("run-langgraph-ok", to_status="approved", reason_code="human_approved")
 
@@ -326,8 +379,10 @@ def test_langgraph_adapter_submit_poll_complete_with_thread_and_checkpoint() ->
     assert adapter.poll(persisted).state == "completed"
 
 
-def test_langgraph_policy_violation_creates_interrupt_and_resume_is_audited() -> None:
-    app = create_app()
+def test_langgraph_policy_violation_creates_interrupt_and_resume_is_audited(
+    server_app: ServerApp,
+) -> None:
+    app = server_app
     app.propose_agent_run(
         spec=_langgraph_spec(
             "run-langgraph-block",
@@ -359,46 +414,15 @@ def test_langgraph_policy_violation_creates_interrupt_and_resume_is_audited() ->
     app.resolve_interrupt(interrupt_id=interrupt_id, action="approve", actor="reviewer")
     app.resume_run("run-langgraph-block", decision={"action": "approve"}, actor="reviewer")
 
-    resumed_events = app.db.list_audit_events("agent_run_resumed")
+    snapshot = app.db.snapshot_run_state("run-langgraph-block")
+    assert not app.db.conn.in_transaction
+    assert snapshot["interrupts"][-1]["status"] == "approved"
+    resumed_events = snapshot["audit_events"]["agent_run_resumed"]
     assert resumed_events[-1]["payload"]["run_id"] == "run-langgraph-block"
 
 
-def test_langgraph_budgets_enforced_for_tokens_and_fail_mode() -> None:
-    app = create_app()
-    app.propose_agent_run(
-        spec=_langgraph_spec(
-            "run-langgraph-budget",
-            policy_violation_mode="fail",
-            execution={
-                "engine": "langgraph",
-                "graph_id": "repo_change_proposer/v1",
-                "thread_id": None,
-                "budget": {
-                    "max_total_tokens": 10,
-                    "max_tool_calls": 10,
-                    "max_wall_seconds": 300,
-                },
-                "tools_allowed": ["github_read"],
-                "scopes": {"repo": "phys-sims/pm-bot"},
-            },
-            simulated_steps=[{"type": "model_call", "tokens": 20, "node_id": "draft"}],
-            max_retries=0,
-        ),
-        created_by="alice",
-    )
-    app.transition_agent_run(
-        "run-langgraph-budget",
-        to_status="approved",
-        reason_code="human_approved",
-    )
-    claimed = app.claim_agent_runs(worker_id="w1", limit=1)
-    assert claimed and claimed[0]["run_id"] == "run-langgraph-budget"
-    result = app.execute_claimed_agent_run(run_id="run-langgraph-budget", worker_id="w1")
-    assert result["status"] == "failed"
-
-
-def test_unapproved_run_cannot_execute_model_or_tool_calls() -> None:
-    app = create_app()
+def test_unapproved_run_cannot_execute_model_or_tool_calls(server_app: ServerApp) -> None:
+    app = server_app
     app.propose_agent_run(spec=_repo_change_proposer_spec("run-unapproved"), created_by="alice")
 
     claimed = app.claim_agent_runs(worker_id="w1", limit=1)
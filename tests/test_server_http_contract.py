@@ -1,63 +1,96 @@
-import asyncio
-import json
-import subprocess
 import pytest
-import sys
+from _asgi_client import asgi_request, json_body
 
 import pm_bot.server.app as app_module
 from pm_bot.server.app import ASGIServer, ServerApp
 
-
-def _asgi_request(
-    app: ASGIServer,
-    method: str,
-    path: str,
-    body: bytes = b"",
-    query_string: bytes = b"",
-) -> tuple[int, dict]:
-    scope = {
-        "type": "http",
-        "method": method,
-        "path": path,
-        "query_string": query_string,
+_APPROVE_BODY = json_body({"approved_by": "human"})
+_DENIED_PROPOSE_BODY = json_body(
+    {
+        "operation": "create_issue",
+        "repo": "outside/repo",
+        "payload": {"title": "Denied"},
     }
-    sent: list[dict] = []
-    received = False
-
-    async def receive() -> dict:
-        nonlocal received
-        if received:
-            return {"type": "http.request", "body": b"", "more_body": False}
-        received = True
-        return {"type": "http.request", "body": body, "more_body": False}
-
-    async def send(message: dict) -> None:
-        sent.append(message)
-
-    asyncio.run(app(scope, receive, send))
-
-    status = next(msg["status"] for msg in sent if msg["type"] == "http.response.start")
-    payload = b"".join(msg.get("body", b"") for msg in sent if msg["type"] == "http.response.body")
-    return status, json.loads(payload.decode("utf-8"))
-
+)
+_EMPTY_BODY = json_body({})
+_GRAPH_INGEST_BODY = json_body({"repo": "phys-sims/phys-pipeline"})
+_AGENT_RUN_PROPOSE_BODY = json_body(
+    {
+        "created_by": "alice",
+        "spec": {
+            "run_id": "http-run-1",
+            "model": "gpt-5",
+            "intent": "HTTP runner",
+            "adapter": "manual",
+            "requires_approval": True,
+        },
+    }
+)
+_AGENT_RUN_APPROVE_BODY = json_body(
+    {
+        "run_id": "http-run-1",
+        "to_status": "approved",
+        "reason_code": "human_approved",
+        "actor": "reviewer",
+    }
+)
+_AGENT_RUN_CLAIM_BODY = json_body({"worker_id": "worker-1", "limit": 1, "lease_seconds": 30})
+_AGENT_RUN_EXECUTE_BODY = json_body({"run_id": "http-run-1", "worker_id": "worker-1"})
+_REPORT_IR_INTAKE_BODY = json_body(
+    {
+        "natural_text": "- Build v6 intake flow\n- Add approval handoff",
+        "org": "phys-sims",
+        "repos": ["phys-sims/phys-pipeline", "phys-sims/pm-bot"],
+        "run_id": "v6-b-flow",
+        "requested_by": "operator",
+        "generated_at": "2026-02-25",
+    }
+)
+_STRUCTURED_REPORT_MARKDOWN = """# Epic: Platform Reliability area=platform priority=P1
+## Feature: Queue hardening estimate=8 depends on feat:retry-policy
+- [ ] Task: Add retry backoff area=platform priority=P1 est=3 blocked by task:db-migration
+- [x] Task: Add dead letter queue area=platform priority=P1 estimate=2
+"""
+_STRUCTURED_INTAKE_BODY = json_body(
+    {
+        "natural_text": _STRUCTURED_REPORT_MARKDOWN,
+        "org": "phys-sims",
+        "repos": ["phys-sims/pm-bot"],
+        "mode": "structured",
+        "generated_at": "2026-02-26",
+    }
+)
+_INVALID_CAPABILITY_INTAKE_BODY = json_body(
+    {
+        "natural_text": "- plan item",
+        "org": "phys-sims",
+        "repos": ["phys-sims/pm-bot"],
+    }
+)
+_LANGGRAPH_RUN_CREATE_BODY = json_body(
+    {
+        "goal": "Ship safe LangGraph run",
+        "repo": "phys-sims/pm-bot",
+        "graph_id": "repo_change_proposer/v1",
+        "created_by": "alice",
+    }
+)
+_REVIEWER_ACTOR_BODY = json_body({"actor": "reviewer"})
 
-def test_documented_server_startup_command_is_available():
-    result = subprocess.run(
-        [sys.executable, "-m", "pm_bot.server.app", "--print-startup"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
 
-    assert result.returncode == 0
-    assert "uvicorn pm_bot.server.app:app --host 127.0.0.1 --port 8000" in result.stdout
+def test_documented_server_startup_command_is_available(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # ``python -m pm_bot.server.app`` only forwards to ``main()``; calling it in-process checks
+    # the same output without paying for a fresh interpreter and package import.
+    assert app_module.main(["--print-startup"]) == 0
+    assert "uvicorn pm_bot.server.app:app --host 127.0.0.1 --port 8000" in capsys.readouterr().out
 
 
-def test_http_health_and_changesets_routes_for_ui():
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_http_health_and_changesets_routes_for_ui(asgi_app: ASGIServer):
+    app = asgi_app
 
-    health_status, health_payload = _asgi_request(app, "GET", "/health")
+    health_status, health_payload = asgi_request(app, "GET", "/health")
     assert health_status == 200
     assert health_payload == {"status": "ok"}
 
@@ -66,61 +99,54 @@ def test_http_health_and_changesets_routes_for_ui():
         "repo": "phys-sims/phys-pipeline",
         "payload": {"issue_ref": "#120", "title": "HTTP flow"},
     }
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         app,
         "POST",
         "/changesets/propose",
-        body=json.dumps(propose_body).encode("utf-8"),
+        body=json_body(propose_body),
     )
     assert status == 200
     assert payload["status"] == "pending"
     assert payload["operation"] == "create_issue"
 
-    pending_status, pending_payload = _asgi_request(app, "GET", "/changesets/pending")
+    pending_status, pending_payload = asgi_request(app, "GET", "/changesets/pending")
     assert pending_status == 200
     assert pending_payload["summary"]["count"] == 1
     assert pending_payload["items"][0]["id"] == payload["id"]
 
-    approve_status, approve_payload = _asgi_request(
+    approve_status, approve_payload = asgi_request(
         app,
         "POST",
         f"/changesets/{payload['id']}/approve",
-        body=json.dumps({"approved_by": "human"}).encode("utf-8"),
+        body=_APPROVE_BODY,
     )
     assert approve_status == 200
     assert approve_payload["status"] == "applied"
 
 
-def test_approval_denials_are_reason_coded_for_http_clients():
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_approval_denials_are_reason_coded_for_http_clients(asgi_app: ASGIServer):
+    app = asgi_app
 
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         app,
         "POST",
         "/changesets/propose",
-        body=json.dumps(
-            {
-                "operation": "create_issue",
-                "repo": "outside/repo",
-                "payload": {"title": "Denied"},
-            }
-        ).encode("utf-8"),
+        body=_DENIED_PROPOSE_BODY,
     )
 
     assert status == 403
     assert payload["reason_code"] == "repo_not_allowlisted"
 
 
-def test_graph_estimator_and_report_routes_for_ui():
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_graph_estimator_and_report_routes_for_ui(server_app: ServerApp, asgi_app: ASGIServer):
+    service = server_app
+    app = asgi_app
 
     service.draft("epic", "Root")
     service.draft("task", "Child")
     service.link_work_items("draft:epic:root", "draft:task:child", source="sub_issue")
 
-    tree_status, tree_payload = _asgi_request(
+    tree_status, tree_payload = asgi_request(
         app,
         "GET",
         "/graph/tree",
@@ -130,33 +156,35 @@ def test_graph_estimator_and_report_routes_for_ui():
     assert tree_payload["root"]["issue_ref"] == "draft:epic:root"
     assert tree_payload["root"]["children"][0]["provenance"] == "sub_issue"
 
-    deps_status, deps_payload = _asgi_request(app, "GET", "/graph/deps")
+    deps_status, deps_payload = asgi_request(app, "GET", "/graph/deps")
     assert deps_status == 200
     assert "summary" in deps_payload
 
-    estimator_status, estimator_payload = _asgi_request(app, "GET", "/estimator/snapshot")
+    estimator_status, estimator_payload = asgi_request(app, "GET", "/estimator/snapshot")
     assert estimator_status == 200
     assert estimator_payload["summary"]["count"] == len(estimator_payload["items"])
 
-    no_report_status, no_report_payload = _asgi_request(app, "GET", "/reports/weekly/latest")
+    no_report_status, no_report_payload = asgi_request(app, "GET", "/reports/weekly/latest")
     assert no_report_status == 404
     assert no_report_payload["error"] == "report_not_found"
 
     service.generate_weekly_report(report_name="weekly-ui.md")
-    latest_status, latest_payload = _asgi_request(app, "GET", "/reports/weekly/latest")
+    latest_status, latest_payload = asgi_request(app, "GET", "/reports/weekly/latest")
     assert latest_status == 200
     assert latest_payload["report_type"] == "weekly"
 
 
-def test_graph_ingest_route_requires_repo_and_returns_diagnostics():
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_graph_ingest_route_requires_repo_and_returns_diagnostics(
+    server_app: ServerApp, asgi_app: ASGIServer
+):
+    service = server_app
+    app = asgi_app
 
-    missing_status, missing_payload = _asgi_request(
+    missing_status, missing_payload = asgi_request(
         app,
         "POST",
         "/graph/ingest",
-        body=json.dumps({}).encode("utf-8"),
+        body=_EMPTY_BODY,
     )
     assert missing_status == 400
     assert missing_payload["error"] == "missing_repo"
@@ -174,71 +202,52 @@ def test_graph_ingest_route_requires_repo_and_returns_diagnostics():
     service.connector.sub_issues[("phys-sims/phys-pipeline", "#77")] = [{"issue_ref": "#78"}]
     service.connector.dependencies[("phys-sims/phys-pipeline", "#77")] = [{"issue_ref": "#76"}]
 
-    ok_status, ok_payload = _asgi_request(
+    ok_status, ok_payload = asgi_request(
         app,
         "POST",
         "/graph/ingest",
-        body=json.dumps({"repo": "phys-sims/phys-pipeline"}).encode("utf-8"),
+        body=_GRAPH_INGEST_BODY,
     )
     assert ok_status == 200
     assert ok_payload["partial"] is False
     assert ok_payload["calls"] >= 1
 
 
-def test_agent_run_routes_cover_propose_transition_claim_execute():
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_agent_run_routes_cover_propose_transition_claim_execute(asgi_app: ASGIServer):
+    app = asgi_app
 
-    propose_status, propose_payload = _asgi_request(
+    propose_status, propose_payload = asgi_request(
         app,
         "POST",
         "/agent-runs/propose",
-        body=json.dumps(
-            {
-                "created_by": "alice",
-                "spec": {
-                    "run_id": "http-run-1",
-                    "model": "gpt-5",
-                    "intent": "HTTP runner",
-                    "adapter": "manual",
-                    "requires_approval": True,
-                },
-            }
-        ).encode("utf-8"),
+        body=_AGENT_RUN_PROPOSE_BODY,
     )
     assert propose_status == 200
     assert propose_payload["status"] == "proposed"
 
-    transition_status, transition_payload = _asgi_request(
+    transition_status, transition_payload = asgi_request(
         app,
         "POST",
         "/agent-runs/transition",
-        body=json.dumps(
-            {
-                "run_id": "http-run-1",
-                "to_status": "approved",
-                "reason_code": "human_approved",
-                "actor": "reviewer",
-            }
-        ).encode("utf-8"),
+        body=_AGENT_RUN_APPROVE_BODY,
     )
     assert transition_status == 200
     assert transition_payload["status"] == "approved"
 
-    claim_status, claim_payload = _asgi_request(
+    claim_status, claim_payload = asgi_request(
         app,
         "POST",
         "/agent-runs/claim",
-        body=json.dumps({"worker_id": "worker-1", "limit": 1, "lease_seconds": 30}).encode("utf-8"),
+        body=_AGENT_RUN_CLAIM_BODY,
     )
     assert claim_status == 200
     assert claim_payload["summary"]["count"] == 1
 
-    execute_status, execute_payload = _asgi_request(
+    execute_status, execute_payload = asgi_request(
         app,
         "POST",
         "/agent-runs/execute",
-        body=json.dumps({"run_id": "http-run-1", "worker_id": "worker-1"}).encode("utf-8"),
+        body=_AGENT_RUN_EXECUTE_BODY,
     )
     assert execute_status == 200
     assert execute_payload["status"] == "completed"
@@ -246,7 +255,7 @@ def test_agent_run_routes_cover_propose_transition_claim_execute():
     assert execute_payload["artifact_paths"][0].startswith("file://")
     assert execute_payload["artifact_paths"][0].endswith("/http-run-1.txt")
 
-    transitions_status, transitions_payload = _asgi_request(
+    transitions_status, transitions_payload = asgi_request(
         app,
         "GET",
         "/agent-runs/transitions",
@@ -256,9 +265,11 @@ def test_agent_run_routes_cover_propose_transition_claim_execute():
     assert transitions_payload["summary"]["count"] >= 2
 
 
-def test_unified_inbox_route_merges_pm_bot_and_github_items() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_unified_inbox_route_merges_pm_bot_and_github_items(
+    server_app: ServerApp, asgi_app: ASGIServer
+) -> None:
+    service = server_app
+    app = asgi_app
 
     proposed = service.propose_changeset(
         operation="create_issue",
@@ -275,7 +286,7 @@ def test_unified_inbox_route_merges_pm_bot_and_github_items() -> None:
         "labels": ["needs-human"],
     }
 
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         app,
         "GET",
         "/inbox",
@@ -291,19 +302,18 @@ def test_unified_inbox_route_merges_pm_bot_and_github_items() -> None:
     assert payload["diagnostics"]["cache"]["hit"] is False
 
 
-def test_onboarding_readiness_and_dry_run_routes() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_onboarding_readiness_and_dry_run_routes(asgi_app: ASGIServer) -> None:
+    app = asgi_app
 
-    readiness_status, readiness_payload = _asgi_request(app, "GET", "/onboarding/readiness")
+    readiness_status, readiness_payload = asgi_request(app, "GET", "/onboarding/readiness")
     assert readiness_status == 200
     assert "readiness_state" in readiness_payload
 
-    dry_run_status, dry_run_payload = _asgi_request(
+    dry_run_status, dry_run_payload = asgi_request(
         app,
         "POST",
         "/onboarding/dry-run",
-        body=json.dumps({}).encode("utf-8"),
+        body=_EMPTY_BODY,
     )
     assert dry_run_status == 200
     assert dry_run_payload["reason_code"] in {
@@ -313,24 +323,14 @@ def test_onboarding_readiness_and_dry_run_routes() -> None:
     }
 
 
-def test_report_ir_intake_confirm_preview_and_propose_routes() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_report_ir_intake_confirm_preview_and_propose_routes(asgi_app: ASGIServer) -> None:
+    app = asgi_app
 
-    intake_status, intake_payload = _asgi_request(
+    intake_status, intake_payload = asgi_request(
         app,
         "POST",
         "/report-ir/intake",
-        body=json.dumps(
-            {
-                "natural_text": "- Build v6 intake flow\n- Add approval handoff",
-                "org": "phys-sims",
-                "repos": ["phys-sims/phys-pipeline", "phys-sims/pm-bot"],
-                "run_id": "v6-b-flow",
-                "requested_by": "operator",
-                "generated_at": "2026-02-25",
-            }
-        ).encode("utf-8"),
+        body=_REPORT_IR_INTAKE_BODY,
     )
     assert intake_status == 200
     assert intake_payload["schema_version"] == "report_ir_draft/v1"
@@ -338,7 +338,7 @@ def test_report_ir_intake_confirm_preview_and_propose_routes() -> None:
     assert report_ir["schema_version"] == "report_ir/v1"
     assert intake_payload["validation"]["errors"] == []
 
-    chain_status, chain_payload = _asgi_request(
+    chain_status, chain_payload = asgi_request(
         app,
         "GET",
         "/audit/chain",
@@ -353,27 +353,27 @@ def test_report_ir_intake_confirm_preview_and_propose_routes() -> None:
     assert llm_metadata["run_id"] == "v6-b-flow"
     assert llm_metadata["input_hash"]
 
-    confirm_status, confirm_payload = _asgi_request(
+    confirm_status, confirm_payload = asgi_request(
         app,
         "POST",
         "/report-ir/confirm",
-        body=json.dumps(
+        body=json_body(
             {
                 "run_id": "v6-b-flow",
                 "confirmed_by": "human-reviewer",
                 "draft": report_ir,
                 "report_ir": report_ir,
             }
-        ).encode("utf-8"),
+        ),
     )
     assert confirm_status == 200
     assert confirm_payload["status"] == "confirmed"
 
-    preview_status, preview_payload = _asgi_request(
+    preview_status, preview_payload = asgi_request(
         app,
         "POST",
         "/report-ir/preview",
-        body=json.dumps({"run_id": "v6-b-flow", "report_ir": report_ir}).encode("utf-8"),
+        body=json_body({"run_id": "v6-b-flow", "report_ir": report_ir}),
     )
     assert preview_status == 200
     assert preview_payload["schema_version"] == "changeset_preview/v1"
@@ -384,33 +384,33 @@ def test_report_ir_intake_confirm_preview_and_propose_routes() -> None:
     assert "nodes" in first_repo_preview
     assert "edges" in first_repo_preview
 
-    propose_status, propose_payload = _asgi_request(
+    propose_status, propose_payload = asgi_request(
         app,
         "POST",
         "/report-ir/propose",
-        body=json.dumps(
+        body=json_body(
             {
                 "run_id": "v6-b-flow",
                 "requested_by": "operator",
                 "report_ir": report_ir,
             }
-        ).encode("utf-8"),
+        ),
     )
     assert propose_status == 200
     assert propose_payload["schema_version"] == "report_ir_proposal/v1"
     assert propose_payload["summary"]["count"] == preview_payload["summary"]["count"]
 
-    repeat_status, repeat_payload = _asgi_request(
+    repeat_status, repeat_payload = asgi_request(
         app,
         "POST",
         "/report-ir/propose",
-        body=json.dumps(
+        body=json_body(
             {
                 "run_id": "v6-b-flow-repeat",
                 "requested_by": "operator",
                 "report_ir": report_ir,
             }
-        ).encode("utf-8"),
+        ),
     )
     assert repeat_status == 200
     assert repeat_payload["summary"]["count"] == propose_payload["summary"]["count"]
@@ -419,29 +419,16 @@ def test_report_ir_intake_confirm_preview_and_propose_routes() -> None:
     ]
 
 
-def test_report_ir_intake_structured_mode_extracts_hierarchy_and_tokens() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
-
-    structured_markdown = """# Epic: Platform Reliability area=platform priority=P1
-## Feature: Queue hardening estimate=8 depends on feat:retry-policy
-- [ ] Task: Add retry backoff area=platform priority=P1 est=3 blocked by task:db-migration
-- [x] Task: Add dead letter queue area=platform priority=P1 estimate=2
-"""
+def test_report_ir_intake_structured_mode_extracts_hierarchy_and_tokens(
+    asgi_app: ASGIServer,
+) -> None:
+    app = asgi_app
 
-    intake_status, intake_payload = _asgi_request(
+    intake_status, intake_payload = asgi_request(
         app,
         "POST",
         "/report-ir/intake",
-        body=json.dumps(
-            {
-                "natural_text": structured_markdown,
-                "org": "phys-sims",
-                "repos": ["phys-sims/pm-bot"],
-                "mode": "structured",
-                "generated_at": "2026-02-26",
-            }
-        ).encode("utf-8"),
+        body=_STRUCTURED_INTAKE_BODY,
     )
 
     assert intake_status == 200
@@ -491,9 +478,11 @@ def test_report_ir_intake_structured_mode_extracts_hierarchy_and_tokens() -> Non
     assert intake_payload["validation"]["errors"] == []
 
 
-def test_audit_chain_rollups_and_incident_bundle_routes() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_audit_chain_rollups_and_incident_bundle_routes(
+    server_app: ServerApp, asgi_app: ASGIServer
+) -> None:
+    service = server_app
+    app = asgi_app
 
     service.db.append_audit_event(
         "agent_run_completed",
@@ -529,7 +518,7 @@ def test_audit_chain_rollups_and_incident_bundle_routes() -> None:
         },
     )
 
-    chain_status, chain_payload = _asgi_request(
+    chain_status, chain_payload = asgi_request(
         app,
         "GET",
         "/audit/chain",
@@ -540,7 +529,7 @@ def test_audit_chain_rollups_and_incident_bundle_routes() -> None:
     assert chain_payload["summary"]["count"] == 2
     assert chain_payload["summary"]["total"] == 2
 
-    rollup_status, rollup_payload = _asgi_request(
+    rollup_status, rollup_payload = asgi_request(
         app,
         "GET",
         "/audit/rollups",
@@ -555,7 +544,7 @@ def test_audit_chain_rollups_and_incident_bundle_routes() -> None:
         {"capability_id": "report_ir_draft", "count": 1}
     ]
 
-    bundle_status, bundle_payload = _asgi_request(
+    bundle_status, bundle_payload = asgi_request(
         app,
         "GET",
         "/audit/incident-bundle",
@@ -568,10 +557,10 @@ def test_audit_chain_rollups_and_incident_bundle_routes() -> None:
 
 
 def test_report_ir_intake_rejects_invalid_capability_output_before_proposal(
-    monkeypatch: pytest.MonkeyPatch,
+    monkeypatch: pytest.MonkeyPatch, server_app: ServerApp, asgi_app: ASGIServer
 ) -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+    service = server_app
+    app = asgi_app
 
     called = {"propose": False}
 
@@ -597,17 +586,11 @@ def test_report_ir_intake_rejects_invalid_capability_output_before_proposal(
     monkeypatch.setattr(service, "propose_report_ir_changesets", _fake_propose)
     monkeypatch.setattr(app_module, "run_capability", _fake_run_capability)
 
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         app,
         "POST",
         "/report-ir/intake",
-        body=json.dumps(
-            {
-                "natural_text": "- plan item",
-                "org": "phys-sims",
-                "repos": ["phys-sims/pm-bot"],
-            }
-        ).encode("utf-8"),
+        body=_INVALID_CAPABILITY_INTAKE_BODY,
     )
 
     assert status == 400
@@ -616,36 +599,31 @@ def test_report_ir_intake_rejects_invalid_capability_output_before_proposal(
     assert payload["validation"]["warnings"][0]["code"] == "COERCION_DISABLED"
     assert called["propose"] is False
 
-    pending_status, pending_payload = _asgi_request(app, "GET", "/changesets/pending")
+    pending_status, pending_payload = asgi_request(app, "GET", "/changesets/pending")
     assert pending_status == 200
     assert pending_payload["summary"]["count"] == 0
 
 
-def test_runs_and_interrupt_routes_cover_v2_contract() -> None:
-    service = ServerApp()
-    app = ASGIServer(service=service)
+def test_runs_and_interrupt_routes_cover_v2_contract(
+    server_app: ServerApp, asgi_app: ASGIServer
+) -> None:
+    service = server_app
+    app = asgi_app
 
-    create_status, create_payload = _asgi_request(
+    create_status, create_payload = asgi_request(
         app,
         "POST",
         "/runs",
-        body=json.dumps(
-            {
-                "goal": "Ship safe LangGraph run",
-                "repo": "phys-sims/pm-bot",
-                "graph_id": "repo_change_proposer/v1",
-                "created_by": "alice",
-            }
-        ).encode("utf-8"),
+        body=_LANGGRAPH_RUN_CREATE_BODY,
     )
     assert create_status == 200
     assert create_payload["graph_id"] == "repo_change_proposer/v1"
 
-    approve_status, approve_payload = _asgi_request(
+    approve_status, approve_payload = asgi_request(
         app,
         "POST",
         f"/runs/{create_payload['run_id']}/approve",
-        body=json.dumps({"actor": "reviewer"}).encode("utf-8"),
+        body=_REVIEWER_ACTOR_BODY,
     )
     assert approve_status == 200
     assert approve_payload["status"] == "approved"
@@ -660,22 +638,22 @@ def test_runs_and_interrupt_routes_cover_v2_contract() -> None:
     )
     assert interrupt["status"] == "pending"
 
-    inbox_status, inbox_payload = _asgi_request(app, "GET", "/inbox")
+    inbox_status, inbox_payload = asgi_request(app, "GET", "/inbox")
     assert inbox_status == 200
     assert inbox_payload["summary"]["interrupt_count"] == 1
 
-    resolve_status, resolve_payload = _asgi_request(
+    resolve_status, resolve_payload = asgi_request(
         app,
         "POST",
         "/interrupts/intr-1/resolve",
-        body=json.dumps(
+        body=json_body(
             {"action": "edit", "actor": "reviewer", "edited_payload": {"tool": "ruff check ."}}
-        ).encode("utf-8"),
+        ),
     )
     assert resolve_status == 200
     assert resolve_payload["status"] == "edited"
 
-    details_status, details_payload = _asgi_request(
+    details_status, details_payload = asgi_request(
         app,
         "GET",
         f"/runs/{create_payload['run_id']}",
@@ -41,8 +41,8 @@ def _expand_three_tasks(service: ServerApp, plan_id: str = "plan-scheduler") ->
     )
 
 
-def test_scheduler_respects_parallel_quota() -> None:
-    service = ServerApp()
+def test_scheduler_respects_parallel_quota(server_app: ServerApp) -> None:
+    service = server_app
     _expand_three_tasks(service)
 
     scheduler = TaskScheduler(
@@ -65,8 +65,8 @@ def test_scheduler_respects_parallel_quota() -> None:
     assert len(pending) == 1
 
 
-def test_scheduler_lease_recovery_allows_reclaim_after_expiry() -> None:
-    service = ServerApp()
+def test_scheduler_lease_recovery_allows_reclaim_after_expiry(server_app: ServerApp) -> None:
+    service = server_app
     _expand_three_tasks(service, plan_id="plan-lease")
     task_run = service.db.list_task_runs("plan-lease")[0]
 
@@ -74,11 +74,7 @@ def test_scheduler_lease_recovery_allows_reclaim_after_expiry() -> None:
         task_run["task_run_id"], worker_id="dead-worker", lease_seconds=1
     )
     assert claimed is True
-    service.db.conn.execute(
-        "UPDATE task_runs SET claim_expires_at = datetime(CURRENT_TIMESTAMP, '-1 seconds') WHERE task_run_id = ?",
-        (task_run["task_run_id"],),
-    )
-    service.db.conn.commit()
+    service.db.expire_task_run_claim(task_run["task_run_id"])
 
     scheduler = TaskScheduler(
         db=service.db,
@@ -95,8 +91,8 @@ def test_scheduler_lease_recovery_allows_reclaim_after_expiry() -> None:
     assert refreshed["claimed_by"] in {"", "scheduler-2"}
 
 
-def test_scheduler_audit_events_include_task_run_correlation() -> None:
-    service = ServerApp()
+def test_scheduler_audit_events_include_task_run_correlation(server_app: ServerApp) -> None:
+    service = server_app
     _expand_three_tasks(service, plan_id="plan-audit")
     task_run = service.db.list_task_runs("plan-audit")[0]
 
@@ -178,42 +178,22 @@ def test_non_retryable_write_failure_marks_changeset_failed_and_audits() -> None
 
 def test_v2_estimator_snapshot_and_predict_fallback():
     app = create_app()
-    app.db.upsert_work_item(
-        "phys-sims/phys-pipeline#1",
-        {
-            "title": "A",
-            "type": "task",
-            "area": "platform",
-            "size": "m",
-            "actual_hrs": 4.0,
-            "fields": {},
-            "relationships": {"children_refs": []},
-        },
-    )
-    app.db.upsert_work_item(
-        "phys-sims/phys-pipeline#2",
-        {
-            "title": "B",
-            "type": "task",
-            "area": "platform",
-            "size": "m",
-            "actual_hrs": 8.0,
-            "fields": {},
-            "relationships": {"children_refs": []},
-        },
-    )
-
-    app.db.upsert_work_item(
-        "phys-sims/phys-pipeline#3",
-        {
-            "title": "C",
-            "type": "task",
-            "area": "platform",
-            "size": "m",
-            "actual_hrs": 6.0,
-            "fields": {},
-            "relationships": {"children_refs": []},
-        },
+    app.db.upsert_work_items(
+        [
+            (
+                f"phys-sims/phys-pipeline#{number}",
+                {
+                    "title": title,
+                    "type": "task",
+                    "area": "platform",
+                    "size": "m",
+                    "actual_hrs": actual_hrs,
+                    "fields": {},
+                    "relationships": {"children_refs": []},
+                },
+            )
+            for number, title, actual_hrs in ((1, "A", 4.0), (2, "B", 8.0), (3, "C", 6.0))
+        ]
     )
 
     snapshots = app.estimator_snapshot()
@@ -1,44 +1,10 @@
-import asyncio
-import json
+from _asgi_client import asgi_request
 
 from pm_bot.server.app import ASGIServer, ServerApp
 
 
-def _asgi_request(
-    app: ASGIServer,
-    method: str,
-    path: str,
-    body: bytes = b"",
-    query_string: bytes = b"",
-) -> tuple[int, dict]:
-    scope = {
-        "type": "http",
-        "method": method,
-        "path": path,
-        "query_string": query_string,
-    }
-    sent: list[dict] = []
-    received = False
-
-    async def receive() -> dict:
-        nonlocal received
-        if received:
-            return {"type": "http.request", "body": b"", "more_body": False}
-        received = True
-        return {"type": "http.request", "body": body, "more_body": False}
-
-    async def send(message: dict) -> None:
-        sent.append(message)
-
-    asyncio.run(app(scope, receive, send))
-
-    status = next(msg["status"] for msg in sent if msg["type"] == "http.response.start")
-    payload = b"".join(msg.get("body", b"") for msg in sent if msg["type"] == "http.response.body")
-    return status, json.loads(payload.decode("utf-8"))
-
-
-def test_context_pack_v2_is_hash_stable_and_budgeted() -> None:
-    app = ServerApp()
+def test_context_pack_v2_is_hash_stable_and_budgeted(server_app: ServerApp) -> None:
+    app = server_app
     parent = app.draft(item_type="epic", title="Parent", body_fields={"Goal": "Big"})
     draft = app.draft(
         item_type="feature", title="Deterministic builder", body_fields={"Goal": "Ship"}
@@ -61,8 +27,8 @@ def test_context_pack_v2_is_hash_stable_and_budgeted() -> None:
     assert first["manifest"]["exclusion_reasons"]["budget_exceeded"] >= 1
 
 
-def test_context_pack_v2_redacts_secret_patterns() -> None:
-    app = ServerApp()
+def test_context_pack_v2_redacts_secret_patterns(server_app: ServerApp) -> None:
+    app = server_app
     draft = app.draft(
         item_type="feature",
         title="Secret redaction",
@@ -75,8 +41,8 @@ def test_context_pack_v2_redacts_secret_patterns() -> None:
     assert pack["manifest"]["redaction_counts"]["categories"]["github_pat"] >= 1
 
 
-def test_context_pack_v1_compatibility_path() -> None:
-    app = ServerApp()
+def test_context_pack_v1_compatibility_path(server_app: ServerApp) -> None:
+    app = server_app
     draft = app.draft(item_type="feature", title="Compat", body_fields={"Goal": "Keep v1"})
 
     v1 = app.context_pack(draft["issue_ref"], schema_version="context_pack/v1")
@@ -91,9 +57,9 @@ def test_context_pack_v2_can_include_retrieved_sections(monkeypatch) -> None:
     service = ServerApp()
     asgi = ASGIServer(service=service)
     draft = service.draft(item_type="task", title="Route", body_fields={"Goal": "Test"})
-    _asgi_request(asgi, "POST", "/rag/index", body=b"{}")
+    asgi_request(asgi, "POST", "/rag/index", body=b"{}")
 
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         asgi,
         "GET",
         "/context-pack",
@@ -110,16 +76,18 @@ def test_context_pack_v2_can_include_retrieved_sections(monkeypatch) -> None:
     assert payload["manifest"]["retrieval"]["chunk_ids"]
 
 
-def test_context_pack_http_route_and_audit_run_filtering() -> None:
-    service = ServerApp()
-    asgi = ASGIServer(service=service)
+def test_context_pack_http_route_and_audit_run_filtering(
+    server_app: ServerApp, asgi_app: ASGIServer
+) -> None:
+    service = server_app
+    asgi = asgi_app
     draft = service.draft(item_type="task", title="Route", body_fields={"Goal": "Test"})
 
-    missing_status, missing_payload = _asgi_request(asgi, "GET", "/context-pack")
+    missing_status, missing_payload = asgi_request(asgi, "GET", "/context-pack")
     assert missing_status == 400
     assert missing_payload["error"] == "missing_issue_ref"
 
-    status, payload = _asgi_request(
+    status, payload = asgi_request(
         asgi,
         "GET",
         "/context-pack",